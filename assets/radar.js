@@ -0,0 +1,122 @@
+// RADAR 클라이언트 컴포넌트 (components.v2, 앱 DOM에 1회 마운트)
+// 단축키·SEO 메타·탭 제목·Back to Top (최초 1회 설치) + 재실행마다 data만 반영: 홈 펄스 표시, 검색창 포커스, 최근 검색 저장
+// data = { pulse: bool, focus: bool, recent: 검색어, og_image: URL }
+const SEARCH_INPUT = 'input[placeholder*="여기에 검색"]';
+const TITLE = 'RADAR - 중고매물 통합검색 & 빈티지 시세 조회';
+const META = [
+    { n: 'description', c: '중고나라, 번개장터, 당근마켓 매물을 한 번에. 실패 없는 중고 거래를 위한 통합 검색 및 빈티지/카메라 시세 분석 서비스 RADAR.' },
+    { n: 'keywords', c: '중고매물 통합검색, 중고 통합검색, 중고 시세 조회, 빈티지 시세, 중고 카메라 시세, RADAR, 라다, 중고거래 통합검색, 중고 시세 통합, 번개장터 시세, 중고나라 시세, 당근마켓 시세, 중고 가격 비교, 중고 시세 분석, 직구 시세, 해외직구 시세, 빈티지 카메라 시세, 중고 물품 시세, 중고 가격 추이, 중고 통합 검색기, 시세 통합 사이트, 중고 시세 검색' },
+    { n: 'author', c: '김진석' },
+    { n: 'naver-site-verification', c: '8a4e84698543f5c3404697202b190be23532de00' }
+];
+const BLIPS = 8;
+
+let installed = false;
+let lastRecent = null;
+
+function setMeta(attr, name, content) {
+    let el = document.head.querySelector('meta[' + attr + '="' + name + '"]');
+    if (!el) { el = document.createElement('meta'); el.setAttribute(attr, name); document.head.appendChild(el); }
+    el.setAttribute('content', content);
+}
+
+function installSeo(ogImage) {
+    const baseUrl = window.location.href.split('?')[0];
+    META.forEach(function(m) { setMeta('name', m.n, m.c); });
+    const og = [
+        { p: 'og:type', c: 'website' },
+        { p: 'og:site_name', c: 'RADAR' },
+        { p: 'og:title', c: TITLE },
+        { p: 'og:description', c: '여기저기 다닐 필요 없습니다. 중고 시세와 매물을 데이터로 통합해 드립니다.' },
+        { p: 'og:url', c: baseUrl }
+    ];
+    if (ogImage) og.push({ p: 'og:image', c: ogImage });
+    og.forEach(function(o) { setMeta('property', o.p, o.c); });
+}
+
+function setTitle() {
+    // Streamlit이 재실행 직후 page_title로 되돌리므로 잠시 뒤 한 번 더
+    document.title = TITLE;
+    setTimeout(function() { document.title = TITLE; }, 400);
+    setTimeout(function() { document.title = TITLE; }, 1200);
+}
+
+function toggleHelp() {
+    const h = document.getElementById('keyboardHint');
+    if (h) h.classList.toggle('show');
+}
+
+function scrollMain() {
+    return document.querySelector('.main') || document.querySelector('[data-testid="stMain"]');
+}
+
+function installGlobal() {
+    // 컴포넌트가 다시 마운트돼도 동작하도록 요소는 이벤트 시점에 조회 (위임)
+    document.body.classList.remove('light-mode');
+    document.addEventListener('click', function(e) {
+        if (!e.target.closest) return;
+        if (e.target.closest('#backToTop')) { const m = scrollMain(); if (m) m.scrollTo({ top: 0, behavior: 'smooth' }); }
+        if (e.target.closest('#helpButton')) toggleHelp();
+    });
+    const main = scrollMain();
+    if (main) main.addEventListener('scroll', function() {
+        const top = document.getElementById('backToTop');
+        if (top) top.classList.toggle('visible', this.scrollTop > 500);
+    });
+    document.addEventListener('keydown', function(e) {
+        const inp = document.querySelector(SEARCH_INPUT);
+        const typing = /^(INPUT|TEXTAREA)$/.test((document.activeElement || {}).tagName || '');
+        if (e.key === '/' && !typing) { e.preventDefault(); if (inp) inp.focus(); }
+        if (e.key === 'Escape' && inp && inp === document.activeElement) { inp.value = ''; inp.blur(); }
+        if (e.key === '?' && !typing) { e.preventDefault(); toggleHelp(); }
+    });
+}
+
+function saveRecentSearch(kw) {
+    try {
+        let r = JSON.parse(localStorage.getItem('radar_recent_searches') || '[]');
+        r = r.filter(function(k) { return k !== kw; });
+        r.unshift(kw);
+        localStorage.setItem('radar_recent_searches', JSON.stringify(r.slice(0, 5)));
+    } catch (e) {}
+}
+
+function renderPulse(root, show) {
+    const wrap = root.querySelector('.home-sonar-wrap');
+    if (!wrap) return;
+    wrap.classList.toggle('pulse-block-hidden', !show);
+    const sonar = wrap.querySelector('.sonar-wrap');
+    if (!show || sonar.querySelector('.sonar-blip')) return;
+    // 블립 위치는 마운트당 한 번만 생성 (중심에서 반지름 12~35%, 멀수록 늦게 깜빡임)
+    for (let i = 0; i < BLIPS; i++) {
+        const a = Math.random() * 2 * Math.PI, r = 12 + Math.random() * 23;
+        const b = document.createElement('div');
+        b.className = 'sonar-blip';
+        b.style.left = (50 + r * Math.cos(a)).toFixed(1) + '%';
+        b.style.top = (50 + r * Math.sin(a)).toFixed(1) + '%';
+        b.style.animationDelay = (2 + (r - 12) / 23 * 5).toFixed(1) + 's';
+        b.style.animationDuration = '9s';
+        sonar.appendChild(b);
+    }
+}
+
+export default function(component) {
+    const data = component.data || {};
+    const root = component.parentElement;
+    if (!installed) {
+        installed = true;
+        try { installSeo(data.og_image || ''); installGlobal(); } catch (e) {}
+    }
+    setTitle();
+    renderPulse(root, !!data.pulse);
+    if (data.focus) {
+        setTimeout(function() {
+            const inp = document.querySelector(SEARCH_INPUT);
+            if (inp && !inp.value) inp.focus();
+        }, 150);
+    }
+    if (data.recent && data.recent !== lastRecent) {
+        lastRecent = data.recent;
+        saveRecentSearch(data.recent);
+    }
+}
@@ -0,0 +1,52 @@
+"""
+시세 일괄 조회 CLI - 검색어 파일(한 줄에 하나)을 시트와 한 번에 매칭해 JSONL로 저장
+
+    python batch_query.py queries.txt -o results.jsonl
+    python batch_query.py queries.txt --sheet ./sheet.csv --nrows 5000
+
+출력 한 줄 = {"query": 검색어, "result": get_trend_data_from_sheet와 같은 dict 또는 null}
+"""
+import argparse
+import json
+import sys
+import time
+
+from radar_engine import DEFAULT_SHEET_URL, read_price_sheet, get_trend_data_batch
+
+
+def read_queries(path):
+    """빈 줄·# 주석 제외, 순서 유지"""
+    with open(path, encoding='utf-8-sig') as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="RADAR 시세 일괄 조회 (JSONL 출력)")
+    parser.add_argument("queries", help="검색어 파일 (한 줄에 하나)")
+    parser.add_argument("-o", "--output", default="-", help="결과 JSONL 경로 (기본: stdout)")
+    parser.add_argument("--sheet", default=DEFAULT_SHEET_URL, help="시세 시트 CSV URL 또는 로컬 경로")
+    parser.add_argument("--nrows", type=int, default=None, help="시트 행 제한")
+    args = parser.parse_args(argv)
+
+    queries = read_queries(args.queries)
+    t0 = time.perf_counter()
+    df = read_price_sheet(args.sheet, nrows=args.nrows)
+    t1 = time.perf_counter()
+    results = get_trend_data_batch(queries, df)
+    t2 = time.perf_counter()
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        for q, r in zip(queries, results):
+            out.write(json.dumps({"query": q, "result": r}, ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    hits = sum(r is not None for r in results)
+    print(f"{len(queries)}개 검색어 · 매칭 {hits}개 · 시트 {len(df)}행 로드 {t1 - t0:.2f}s · 매칭 {t2 - t1:.2f}s",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+"""
+시세 엔진 마이크로 벤치마크 - Streamlit 서버·네트워크 없이 합성 시트로 측정
+
+    python benchmark.py                      # 1k / 10k / 100k 행
+    python benchmark.py --rows 1000 5000 --queries 500 --json bench.json
+    python benchmark.py --rerun 30 [--rerun-query "라이카 M6"]   # app.py 재실행 비용 (streamlit 필요)
+
+함수별(app.py 래퍼가 호출하는 radar_engine 경로 그대로, 결과 캐시 없이) 검색어당 p50/p99 지연과 peak 메모리 출력.
+  get_trend_data_from_sheet   PriceIndex 빌드 + lookup
+  get_category_from_sheet     CategoryIndex 빌드 + lookup
+  get_sheet_keywords          extract_sheet_keywords (시트 1회 추출)
+  classify_keyword_category   시트 분류 우선 → classify_keyword
+"""
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from radar_engine import PriceIndex, CategoryIndex, extract_sheet_keywords, classify_keyword
+
+# (한글 브랜드, 영문 브랜드, 분류, 모델들)
+_BRANDS = [
+    ("라이카", "Leica", "CAMERA", ["M6", "M3", "Q3", "Q2", "M11", "CL", "X2"]),
+    ("소니", "Sony", "CAMERA", ["A7RV", "A7M4", "A7C2", "ZV-E10", "RX100M7"]),
+    ("후지필름", "Fujifilm", "CAMERA", ["X100VI", "X100V", "X-T5", "X-Pro3", "GFX100S"]),
+    ("니콘", "Nikon", "CAMERA", ["Z8", "Z6III", "FM2", "F3", "Zf"]),
+    ("캐논", "Canon", "CAMERA", ["R6 Mark II", "R5", "AE-1", "EOS R8"]),
+    ("아이폰", "iPhone", "TECH", ["15", "15 Pro", "16 Pro", "16 Pro Max", "14"]),
+    ("갤럭시", "Galaxy", "TECH", ["S24", "S25 울트라", "Z폴드6", "Z플립6", "탭 S9"]),
+    ("맥북", "MacBook", "TECH", ["에어 M2", "에어 M3", "프로 M4", "프로 14"]),
+    ("나이키", "Nike", "FASHION", ["덩크 로우", "에어포스 1", "조던 1 로우", "ACG"]),
+    ("롤렉스", "Rolex", "FASHION", ["서브마리너", "데이저스트", "GMT 마스터"]),
+    ("다이슨", "Dyson", "LIVING", ["V15", "에어랩", "에어스트레이트"]),
+    ("발뮤다", "Balmuda", "LIVING", ["토스터", "전기포트"]),
+    ("닌텐도", "Nintendo", "GAME", ["스위치 2", "스위치 OLED"]),
+    ("플스", "PlayStation", "GAME", ["5 Pro", "5 디지털"]),
+]
+_SUFFIXES = ["", "", "", " 블랙", " 실버", " 화이트", " 중고", " A급", " 풀박스", " 128GB", " 256GB", " 미개봉"]
+_WEEKS = ["12월4주", "1월1주", "1월2주", "1월3주", "1월4주"]
+_MISSES = ["냉장고", "자전거 헬멧", "zzzz", "테슬라 모델Y", "커피 그라인더", "x"]
+
+
+def make_sheet(rows, seed=0):
+    """
+    합성 시세 시트 - 한·영 혼합 모델명, 분류, 주차 컬럼(_get_date_cols 탐지), 시세 (5주치) 원본 문자열, 해외평균(USD)
+    """
+    r = random.Random(seed)
+    out = []
+    for _ in range(rows):
+        ko, en, cat, models = r.choice(_BRANDS)
+        name = f"{ko if r.random() < 0.6 else en} {r.choice(models)}{r.choice(_SUFFIXES)}"
+        if r.random() < 0.05:
+            name += f" {r.randint(1, 999)}"  # 희귀 변형 (키워드 다양성)
+        base = r.uniform(5, 600)
+        weeks = {}
+        for w in _WEEKS:
+            if r.random() < 0.15:
+                weeks[w] = np.nan
+            else:
+                weeks[w] = ", ".join(f"{base * r.uniform(0.85, 1.15):.1f}" for _ in range(r.randint(1, 6)))
+        raw = ", ".join(f"{base * r.uniform(0.8, 1.2):.0f}" for _ in range(r.randint(3, 15))) if r.random() < 0.5 else np.nan
+        usd = r.choice([np.nan, f"${base * 7:,.0f}", f"{base * 7:.0f}"])
+        out.append({"모델명": name, "분류": cat if r.random() < 0.8 else np.nan, **weeks,
+                    "시세 (5주치)": raw, "해외평균(USD)": usd})
+    return pd.DataFrame(out)
+
+
+def make_queries(df, n, seed=1):
+    """검색어 - 정확 일치, 공백·대소문자 변형, 오타(한 글자 삭제), 브랜드만, 미등록 검색어 혼합"""
+    r = random.Random(seed)
+    names = df["모델명"].dropna().astype(str).tolist()
+    out = []
+    for _ in range(n):
+        kind = r.random()
+        name = r.choice(names)
+        if kind < 0.35:
+            q = name
+        elif kind < 0.5:
+            q = name.replace(" ", "").upper() if r.random() < 0.5 else name.lower()
+        elif kind < 0.7 and len(name) > 3:
+            i = r.randrange(len(name))
+            q = name[:i] + name[i + 1:]
+        elif kind < 0.85:
+            q = name.split()[0]
+        else:
+            q = r.choice(_MISSES)
+        out.append(q)
+    return out
+
+
+def _percentiles(samples_ns):
+    a = np.asarray(samples_ns, dtype=np.float64) / 1e6
+    return float(np.percentile(a, 50)), float(np.percentile(a, 99))
+
+
+def _run(build, call, queries):
+    """(빌드 ms, 검색어별 지연 ns 목록) - gc 끄고 측정"""
+    gc.collect()
+    gc.disable()
+    try:
+        t0 = time.perf_counter_ns()
+        obj = build()
+        build_ms = (time.perf_counter_ns() - t0) / 1e6
+        samples = []
+        for q in queries:
+            t = time.perf_counter_ns()
+            call(obj, q)
+            samples.append(time.perf_counter_ns() - t)
+    finally:
+        gc.enable()
+    return build_ms, samples
+
+
+def _peak_mb(build, call, queries):
+    """빌드 + 전체 검색어 처리 중 peak 메모리 (tracemalloc, 지연 측정과 별도 실행)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        obj = build()
+        for q in queries:
+            call(obj, q)
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def bench_cases(df, queries):
+    """(이름, build(), call(obj, q), 검색어 목록) - app.py 래퍼와 같은 엔진 경로, 결과 캐시 제외"""
+    def classify(cat_index, q):
+        return (cat_index._lookup(q) if len(q.strip()) >= 2 else None) or classify_keyword(q)
+
+    def trend(index, q):
+        return index.lookup(q) if len(q.lower().replace(" ", "").strip()) >= 2 else None
+
+    return [
+        ("get_trend_data_from_sheet", lambda: PriceIndex(df), trend, queries),
+        ("get_category_from_sheet", lambda: CategoryIndex(df), lambda idx, q: idx._lookup(q), queries),
+        ("get_sheet_keywords", lambda: df, lambda d, _: extract_sheet_keywords(d), queries[:20]),
+        ("classify_keyword_category", lambda: CategoryIndex(df), classify, queries),
+    ]
+
+
+def run(rows_list, n_queries, seed=0, memory=True):
+    results = []
+    for rows in rows_list:
+        df = make_sheet(rows, seed=seed)
+        queries = make_queries(df, n_queries, seed=seed + 1)
+        for name, build, call, qs in bench_cases(df, queries):
+            build_ms, samples = _run(build, call, qs)
+            p50, p99 = _percentiles(samples)
+            results.append({"function": name, "rows": rows, "queries": len(qs), "build_ms": round(build_ms, 2),
+                            "p50_ms": round(p50, 4), "p99_ms": round(p99, 4),
+                            "peak_mb": round(_peak_mb(build, call, qs), 2) if memory else None})
+            print(f"{rows:>7,}행  {name:<27} 빌드 {build_ms:9.1f}ms  p50 {p50:8.3f}ms  p99 {p99:8.3f}ms"
+                  + (f"  peak {results[-1]['peak_mb']:7.1f}MB" if memory else ""))
+    return results
+
+
+def bench_rerun(runs, sheet=None, query=None):
+    """
+    app.py 스크립트 재실행 비용 (Streamlit AppTest, 서버·브라우저 없음) - 위젯 조작 1회 = 재실행 1회.
+    시트는 로컬 CSV (없으면 합성 3천 행), 첫 실행(캐시 준비)은 제외하고 p50/p99
+    """
+    import os
+    import tempfile
+    from streamlit.testing.v1 import AppTest
+
+    tmp = tempfile.mkdtemp(prefix="radar-bench-")
+    if sheet is None:
+        sheet = os.path.join(tmp, "sheet.csv")
+        make_sheet(3000).to_csv(sheet, index=False, encoding="utf-8-sig")
+    app_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+    at = AppTest.from_file(app_path, default_timeout=120)
+    at.secrets["google_sheet_url"] = sheet
+    at.secrets["cache_dir"] = tmp
+    at.run()
+    if query:
+        at.text_input(key="search_input").set_value(query)
+        at.run()
+    samples = []
+    for _ in range(runs):
+        t = time.perf_counter_ns()
+        at.run()
+        samples.append(time.perf_counter_ns() - t)
+    p50, p99 = _percentiles(samples)
+    print(f"app.py 재실행 {runs}회{f' (검색: {query})' if query else ''}  p50 {p50:8.1f}ms  p99 {p99:8.1f}ms")
+    return {"function": "app_rerun", "runs": runs, "query": query, "p50_ms": round(p50, 2), "p99_ms": round(p99, 2)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="RADAR 시세 엔진 벤치마크 (합성 시트, 오프라인)")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000], help="시트 행 수 (여러 개)")
+    parser.add_argument("--queries", type=int, default=300, help="함수별 검색어 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="peak 메모리 측정 생략 (tracemalloc 재실행 없음)")
+    parser.add_argument("--json", help="결과 JSON 저장 경로")
+    parser.add_argument("--rerun", type=int, default=0, metavar="N", help="app.py 재실행 비용 N회 측정 (streamlit 필요)")
+    parser.add_argument("--rerun-query", help="재실행 측정 시 검색어 입력 상태로 측정")
+    parser.add_argument("--sheet", help="재실행 측정용 시트 CSV 경로 (기본: 합성 3천 행)")
+    parser.add_argument("--dump-sheet", help="첫 번째 크기의 합성 시트를 CSV로 저장 (batch_query.py --sheet 용)")
+    args = parser.parse_args(argv)
+
+    if args.dump_sheet:
+        make_sheet(args.rows[0], seed=args.seed).to_csv(args.dump_sheet, index=False, encoding="utf-8-sig")
+    if args.rerun:
+        results = [bench_rerun(args.rerun, sheet=args.sheet, query=args.rerun_query)]
+    else:
+        results = run(args.rows, args.queries, seed=args.seed, memory=not args.no_memory)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2185 @@
+"""
+RADAR 시세 엔진 - 구글 시트 로드·파싱·매칭·분류, 커뮤니티 추천, 직구 비용 계산 (Streamlit 없이 import 가능)
+app.py와 배치 작업(batch_query.py, benchmark.py)이 같은 로직을 공유.
+import 시 pandas/numpy·네트워크 작업 없음 (pandas/numpy는 쓰는 함수 안에서 import) - 콜드 import 수 ms
+"""
+import re
+import io
+import os
+import json
+import time
+import hashlib
+import bisect
+import difflib
+import heapq
+import functools
+import math
+import threading
+import weakref
+import urllib.parse
+from collections import OrderedDict, deque
+from pathlib import Path
+
+# 시트 구조: 모델명/키워드 | 시세(5주치) 또는 주차별 컬럼 | 해외평균(USD)
+DEFAULT_SHEET_URL = "https://docs.google.com/spreadsheets/d/e/2PACX-1vQS8AftSUmG9Cr7MfczpotB5hhl1DgjH4hRCgXH5R8j5hykRiEf0M9rEyEq3uj312a5RuI4zMdjI5Jr/pub?output=csv"
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".radar_cache"
+
+def read_price_sheet(url=DEFAULT_SHEET_URL, nrows=None):
+    """시세 시트(CSV URL·로컬 경로·바이트 버퍼) 읽기 - 컬럼명 공백/BOM 정리"""
+    import pandas as pd
+    df = pd.read_csv(url, encoding='utf-8-sig', nrows=nrows)
+    df.columns = df.columns.str.strip().str.replace('\ufeff', '')
+    return df
+
+# [시트 버전] DataFrame 객체별 지문 - 파생 캐시 키 (st.cache 인자 DataFrame 해싱 대체)
+_SHEET_VERSIONS = {}  # id(df) → (weakref, version)
+_SHEET_VERSIONS_LOCK = threading.Lock()
+
+def set_sheet_version(df, version):
+    """df에 버전 지정 (스냅샷 내용 해시 등) - df가 해제되면 자동 삭제"""
+    key = id(df)
+    ref = weakref.ref(df, lambda _, key=key: _SHEET_VERSIONS.pop(key, None))
+    with _SHEET_VERSIONS_LOCK:
+        _SHEET_VERSIONS[key] = (ref, version)
+    return version
+
+_SHEET_MATRICES = {}  # id(df) → (weakref, PriceMatrix) - 스냅샷 파일에서 memory-map으로 읽은 시세 배열
+
+def set_sheet_matrix(df, matrix):
+    """df에 미리 파싱된 PriceMatrix 연결 (PriceIndex가 다시 파싱하지 않음) - df가 해제되면 자동 삭제"""
+    key = id(df)
+    ref = weakref.ref(df, lambda _, key=key: _SHEET_MATRICES.pop(key, None))
+    with _SHEET_VERSIONS_LOCK:
+        _SHEET_MATRICES[key] = (ref, matrix)
+    return matrix
+
+def sheet_matrix(df):
+    """연결된 PriceMatrix (없으면 None)"""
+    hit = _SHEET_MATRICES.get(id(df)) if df is not None else None
+    return hit[1] if hit is not None and hit[0]() is df else None
+
+def sheet_version(df):
+    """시트 버전 문자열 - 지정된 값이 없으면 컬럼·셀 해시로 1회 계산 후 재사용"""
+    import pandas as pd
+    if df is None or df.empty:
+        return "empty"
+    hit = _SHEET_VERSIONS.get(id(df))
+    if hit is not None and hit[0]() is df:
+        return hit[1]
+    h = hashlib.sha1("\x1f".join(map(str, df.columns)).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return set_sheet_version(df, "h:" + h.hexdigest()[:16])
+
+class SingleFlight:
+    """
+    같은 키 동시 계산 합치기 - 진행 중인 키는 첫 호출자(리더)만 계산, 나머지는 그 결과(또는 예외)를 기다려 공유.
+    완료 즉시 키 제거 (결과 보관 없음 - 캐시는 호출 쪽). calls=실제 계산 수, shared=합쳐서 아낀 중복 계산 수
+    """
+
+    def __init__(self):
+        self._inflight = {}  # key → Future
+        self._lock = threading.Lock()
+        self.calls = self.shared = self.errors = 0
+
+    def do(self, key, fn):
+        from concurrent.futures import Future
+        with self._lock:
+            fut = self._inflight.get(key)
+            leader = fut is None
+            if leader:
+                fut = self._inflight[key] = Future()
+                self.calls += 1
+            else:
+                self.shared += 1
+        if not leader:
+            return fut.result()
+        try:
+            value = fn()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+                self.errors += 1
+            fut.set_exception(e)
+            raise
+        with self._lock:
+            self._inflight.pop(key, None)
+        fut.set_result(value)
+        return value
+
+    def stats(self):
+        return {"calls": self.calls, "shared": self.shared, "errors": self.errors, "inflight": len(self._inflight)}
+
+class VersionedLRU:
+    """
+    (시트 버전, 정규화 키) → 결과 LRU - DataFrame 해싱 없는 조회 캐시.
+    크기 상한으로 메모리 고정, 적중/미스/축출/합침 카운터 (stats). 스레드 안전 (계산은 락 밖, 같은 키 동시 미스는 1회만 계산)
+    """
+    _MISSING = object()
+
+    def __init__(self, maxsize=2048):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+        self.hits = self.misses = self.evictions = 0
+
+    def _lookup(self, k):
+        with self._lock:
+            value = self._data.get(k, self._MISSING)
+            if value is not self._MISSING:
+                self._data.move_to_end(k)
+            return value
+
+    def get_or_compute(self, version, key, compute):
+        k = (version, key)
+        with self._lock:
+            value = self._data.get(k, self._MISSING)
+            if value is not self._MISSING:
+                self._data.move_to_end(k)
+                self.hits += 1
+                return value
+            self.misses += 1
+
+        def compute_and_store():
+            # 앞선 리더가 방금 끝내고 flight를 비운 경우 - 저장된 값 재사용
+            value = self._lookup(k)
+            if value is not self._MISSING:
+                return value
+            value = compute()
+            with self._lock:
+                self._data[k] = value
+                self._data.move_to_end(k)
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+                    self.evictions += 1
+            return value
+
+        return self._flight.do(k, compute_and_store)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "coalesced": self._flight.shared, "size": len(self._data), "maxsize": self.maxsize}
+
+def _write_atomic(path, write):
+    """임시 파일에 쓴 뒤 os.replace - 읽는 쪽은 항상 완전한 파일만 봄"""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    write(tmp)
+    os.replace(tmp, path)
+
+# [정적 자산] CSS/JS 축소 + 내용 해시 파일명 게시 (Streamlit static 폴더 → app/static/<파일명>)
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_PUNCT = re.compile(r"\s*([{};,>])\s*")
+
+def minify_css(text):
+    """주석 제거 + 공백 압축 ({ } ; , > 주변 공백 삭제) - 선택자 안 ':' 앞 공백 등 의미 있는 공백은 유지"""
+    text = _CSS_COMMENT.sub("", text)
+    text = re.sub(r"\s+", " ", text)
+    return _CSS_PUNCT.sub(r"\1", text).replace(";}", "}").strip()
+
+def minify_js(text):
+    """줄 앞뒤 공백·빈 줄만 제거 (줄바꿈 유지 - 세미콜론 자동 삽입·// 주석 안전)"""
+    return "\n".join(line.strip() for line in text.splitlines() if line.strip())
+
+def publish_static_asset(static_dir, name, text):
+    """
+    'radar.css' → static_dir/radar.<sha256 12자>.css 저장 (같은 내용이면 재사용), 같은 이름의 이전 해시 파일 정리.
+    내용이 바뀌면 파일명이 바뀌므로 브라우저 캐시가 낡은 자산을 쓰지 않음. 저장한 파일명 반환
+    """
+    static_dir = Path(static_dir)
+    stem, ext = os.path.splitext(name)
+    data = text.encode("utf-8")
+    fname = f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}{ext}"
+    static_dir.mkdir(parents=True, exist_ok=True)
+    path = static_dir / fname
+    if not path.exists():
+        _write_atomic(path, lambda p: p.write_bytes(data))
+    stale = re.compile(rf"{re.escape(stem)}\.[0-9a-f]{{12}}{re.escape(ext)}")
+    for old in static_dir.iterdir():
+        if old.name != fname and stale.fullmatch(old.name):
+            try:
+                old.unlink()
+            except OSError:
+                pass
+    return fname
+
+# [HTTP] 프로세스 공유 세션 (연결 재사용 + 일시 오류 재시도) / IO 작업용 공유 스레드 풀
+_HTTP_SESSIONS = {}  # retry 여부 → Session
+_IO_POOL = None
+_POOL_LOCK = threading.Lock()
+
+def http_session(retry=True):
+    """
+    keep-alive 연결 풀 세션 (프로세스 공유). retry=True: GET 재시도 2회 (연결 오류·5xx, 0.3s 지수 백오프) - 시트·환율.
+    읽기 타임아웃·429는 재시도 안 함 (느린 응답을 몇 배로 늘리거나 rate limit을 악화시키지 않도록).
+    retry=False: 재시도 없음 - 화면이 기다리는 번역 호출용 (timeout이 곧 최대 대기)
+    """
+    with _POOL_LOCK:
+        session = _HTTP_SESSIONS.get(retry)
+        if session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            max_retries = (Retry(total=2, read=0, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504),
+                                 allowed_methods=frozenset({"GET"}), raise_on_status=False) if retry else 0)
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=max_retries)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _HTTP_SESSIONS[retry] = session
+        return session
+
+def io_executor():
+    """네트워크 호출 병렬 실행용 프로세스 공유 스레드 풀"""
+    global _IO_POOL
+    with _POOL_LOCK:
+        if _IO_POOL is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="radar-io")
+        return _IO_POOL
+
+class SheetSnapshot:
+    """
+    구글 시트 로컬 스냅샷 (Arrow/Feather + 파싱된 시세 배열 + 메타 JSON, pyarrow 없으면 pickle).
+    Arrow 파일은 무압축으로 저장해 memory-map으로 읽음 → 같은 호스트의 프로세스들이 시트·시세 배열 페이지를 복사 없이 공유.
+    있으면 즉시 디스크에서 읽고, max_age가 지나면 ETag/Last-Modified 조건부 요청 + 내용 해시로 백그라운드 갱신.
+    갱신 실패 시 마지막 정상 스냅샷을 계속 사용.
+    shared(SharedCache) 지정 시 같은 cache_dir을 쓰는 레플리카 중 임대를 얻은 하나만 원본 조회, 나머지는 그 스냅샷을 읽음
+    """
+
+    def __init__(self, url, nrows=None, cache_dir=None, max_age=600, timeout=10, shared=None):
+        self.url, self.nrows, self.max_age, self.timeout, self.shared = url, nrows, max_age, timeout, shared
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        key = hashlib.sha1(f"{url}|{nrows}".encode()).hexdigest()[:16]
+        try:
+            import pyarrow  # noqa: F401 - Arrow IPC (streamlit 의존성으로 보통 설치됨)
+            self._fmt = "arrow"
+        except ImportError:
+            self._fmt = "pkl"
+        self.data_path = self.cache_dir / f"sheet-{key}.{self._fmt}"
+        self.prices_path = self.cache_dir / f"sheet-{key}.prices.arrow"  # PriceMatrix.write_arrow
+        self.meta_path = self.cache_dir / f"sheet-{key}.json"
+        self.key = key
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()  # 동시 갱신(요청 스레드·백그라운드)은 다운로드 1회로 합침
+        self._refreshing = False
+        self.last_error = None
+
+    def _read_meta(self):
+        try:
+            return json.loads(self.meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def load(self):
+        """디스크 스냅샷 → (df 또는 None, meta)"""
+        import pandas as pd
+        meta = self._read_meta()
+        if not meta or not self.data_path.exists():
+            return None, meta
+        try:
+            if self._fmt == "arrow":
+                from pyarrow import feather
+                # 문자열 컬럼은 매핑된 Arrow 버퍼를 그대로 쓰는 str dtype (pandas 3) - 프로세스별 복사 없음
+                df = feather.read_table(str(self.data_path), memory_map=True).to_pandas()
+            else:
+                df = pd.read_pickle(self.data_path)
+        except Exception:
+            return None, meta
+        self._tag(df, meta.get("sha256"))
+        if self._fmt == "arrow":
+            self._attach_prices(df, meta.get("sha256"))
+        return df, meta
+
+    def _attach_prices(self, df, digest):
+        """시세 배열 파일(같은 내용 해시)을 memory-map으로 연결 - 없거나 낡았으면 한 번 파싱해 저장 (실패해도 PriceIndex가 직접 파싱)"""
+        try:
+            matrix = PriceMatrix.read_arrow(self.prices_path, version=digest) if self.prices_path.exists() else None
+            if matrix is None or len(matrix) != len(df):
+                PriceMatrix(df).write_arrow(self.prices_path, version=digest)
+                matrix = PriceMatrix.read_arrow(self.prices_path, version=digest)
+            set_sheet_matrix(df, matrix)
+        except Exception:
+            pass
+
+    def _tag(self, df, digest):
+        """스냅샷 df 버전 = (url, nrows) 키 + 원본 내용 해시 - 같은 내용이면 재시작 후에도 같은 버전"""
+        if digest:
+            set_sheet_version(df, f"{self.key}:{digest[:16]}")
+
+    def is_stale(self, meta):
+        return time.time() - float(meta.get("checked_at", 0)) > self.max_age
+
+    def refresh(self, seen=None):
+        """원본 조건부 요청 - 변경 시 새 df 저장·반환, 미변경(304/같은 해시)이면 None. 네트워크 오류는 예외.
+        shared 사용 시: 다른 레플리카가 조회 중이면 그 결과를 기다리고, 방금 갱신됐으면 조회 없이 디스크에서 읽음 (seen=호출자가 가진 해시)"""
+        if self.shared is None:
+            return self._fetch()
+        lease_ttl = self.timeout * 3
+        if not self.shared.claim("sheet-refresh", self.key, lease_ttl):
+            return self._await_peer(self._read_meta(), seen, lease_ttl)
+        try:
+            meta = self._read_meta()
+            if meta and self.data_path.exists() and not self.is_stale(meta):
+                return self.load()[0] if meta.get("sha256") != seen else None
+            return self._fetch()
+        finally:
+            self.shared.release("sheet-refresh", self.key)
+
+    def _await_peer(self, meta, seen, wait):
+        """다른 레플리카의 갱신 완료(메타 checked_at 변경)까지 대기 → 바뀐 스냅샷이면 디스크에서 읽어 반환"""
+        deadline = time.time() + wait
+        while time.time() < deadline:
+            time.sleep(0.2)
+            new = self._read_meta()
+            if new.get("checked_at") != meta.get("checked_at"):
+                return self.load()[0] if new.get("sha256") != seen else None
+        return None
+
+    def _fetch(self):
+        meta = self._read_meta()
+        headers = {}
+        if not self.data_path.exists():
+            meta = {}  # 데이터 파일이 없으면 조건부 요청 없이 전체 다운로드
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        resp = http_session().get(self.url, headers=headers, timeout=self.timeout)
+        now = time.time()
+        if resp.status_code == 304:
+            self._save_meta(meta, checked_at=now)
+            return None
+        resp.raise_for_status()
+        body = resp.content
+        digest = hashlib.sha256(body).hexdigest()
+        if digest == meta.get("sha256"):
+            self._save_meta(meta, checked_at=now, etag=resp.headers.get("ETag"), last_modified=resp.headers.get("Last-Modified"))
+            return None
+        df = read_price_sheet(io.BytesIO(body), nrows=self.nrows)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        if self._fmt == "arrow":
+            from pyarrow import feather
+            _write_atomic(self.data_path, lambda p: feather.write_feather(df, str(p), compression="uncompressed"))
+            try:
+                PriceMatrix(df).write_arrow(self.prices_path, version=digest)
+            except Exception:
+                pass
+        else:
+            _write_atomic(self.data_path, lambda p: df.to_pickle(p))
+        self._tag(df, digest)
+        self._save_meta({}, url=self.url, sha256=digest, rows=len(df), fetched_at=now, checked_at=now,
+                        etag=resp.headers.get("ETag"), last_modified=resp.headers.get("Last-Modified"))
+        if self._fmt == "arrow":
+            # 방금 파싱한 힙 df 대신 매핑된 스냅샷 반환 (이 프로세스도 다른 레플리카와 같은 페이지 공유)
+            mapped, _ = self.load()
+            if mapped is not None:
+                return mapped
+        return df
+
+    def _save_meta(self, meta, **updates):
+        meta = {**meta, **{k: v for k, v in updates.items() if v is not None}}
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        _write_atomic(self.meta_path, lambda p: p.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8"))
+
+    def _refresh_shared(self, seen=None):
+        return self._flight.do("refresh", lambda: self.refresh(seen))
+
+    def _refresh_quietly(self):
+        try:
+            self._refresh_shared()
+            self.last_error = None
+        except Exception as e:
+            self.last_error = e
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def refresh_in_background(self):
+        """갱신 스레드 시작 (이미 진행 중이면 무시)"""
+        with self._lock:
+            if self._refreshing:
+                return False
+            self._refreshing = True
+        threading.Thread(target=self._refresh_quietly, name="radar-sheet-refresh", daemon=True).start()
+        return True
+
+    def get(self, background=True):
+        """스냅샷 즉시 반환 (오래됐으면 갱신) - background=False면 이 스레드에서 갱신 후 반환 (실패 시 기존 스냅샷)"""
+        import pandas as pd
+        df, meta = self.load()
+        if df is None:
+            df = self._refresh_shared()
+            if df is None:  # 304인데 데이터 파일이 깨진 경우 등
+                df, _ = self.load()
+            return df if df is not None else pd.DataFrame()
+        if self.is_stale(meta):
+            if background:
+                self.refresh_in_background()
+            else:
+                try:
+                    new_df = self._refresh_shared(meta.get("sha256"))
+                    self.last_error = None
+                    if new_df is not None:
+                        return new_df
+                except Exception as e:
+                    self.last_error = e
+        return df
+
+_SNAPSHOTS = {}
+_SNAPSHOTS_LOCK = threading.Lock()
+
+def get_sheet_snapshot(url, nrows=None, cache_dir=None, max_age=600, shared=None):
+    """(url, nrows, cache_dir)당 프로세스 공유 SheetSnapshot"""
+    key = (url, nrows, str(cache_dir) if cache_dir else None)
+    with _SNAPSHOTS_LOCK:
+        snap = _SNAPSHOTS.get(key)
+        if snap is None:
+            snap = _SNAPSHOTS[key] = SheetSnapshot(url, nrows=nrows, cache_dir=cache_dir, max_age=max_age, shared=shared)
+        elif shared is not None:
+            snap.shared = shared
+        return snap
+
+_SHEET_READS = SingleFlight()
+
+def load_price_sheet(url=DEFAULT_SHEET_URL, nrows=None, cache_dir=None, max_age=600, background=True, shared=None):
+    """시세 시트 로드 - http(s) URL은 로컬 스냅샷 경유, 로컬 경로는 직접 읽기 (같은 경로 동시 읽기는 1회로 합침)"""
+    if not str(url).startswith(("http://", "https://")):
+        return _SHEET_READS.do((str(url), nrows), lambda: read_price_sheet(url, nrows=nrows))
+    return get_sheet_snapshot(url, nrows=nrows, cache_dir=cache_dir, max_age=max_age, shared=shared).get(background=background)
+
+def sheet_load_stats():
+    """시트 로드 합침 카운터 - 로컬 읽기 + 스냅샷 다운로드 (calls=실제 로드, shared=합쳐서 아낀 로드)"""
+    flights = [_SHEET_READS] + [snap._flight for snap in list(_SNAPSHOTS.values())]
+    return {k: sum(f.stats()[k] for f in flights) for k in ("calls", "shared", "errors", "inflight")}
+
+class BackgroundRefresher:
+    """
+    주기적 백그라운드 갱신 - 프로세스당 스레드 1개가 작업별 주기로 값을 다시 계산해 통째로 교체.
+    요청 경로는 get()으로 현재 값만 읽음 (첫 값이 준비되기 전에만 대기). 실패 시 이전 값 유지 + retry 주기로 재시도
+    """
+
+    def __init__(self, tick=1.0):
+        self.tick = tick
+        self._jobs = {}    # name → {fn, interval, retry, next_at}
+        self._values = {}  # name → 현재 값 (교체만, 수정 없음)
+        self._ready = {}   # name → 첫 시도 완료 Event
+        self.errors = {}
+        self.updated_at = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def add(self, name, fn, interval, retry=60, initial=None):
+        """작업 등록 - 등록 순서대로 첫 실행 (화면에 먼저 필요한 값을 먼저 등록).
+        initial이 있으면 첫 실행을 기다리지 않고 그 값부터 제공 (디스크에 남은 마지막 값 등)"""
+        with self._lock:
+            self._jobs[name] = {"fn": fn, "interval": interval, "retry": min(retry, interval), "next_at": 0.0}
+            self._ready.setdefault(name, threading.Event())
+            if initial is not None:
+                self._values[name] = initial
+                self._ready[name].set()
+        self._wake.set()
+        return self
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="radar-refresher", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def refresh_now(self, name):
+        """다음 tick에 즉시 갱신"""
+        with self._lock:
+            if name in self._jobs:
+                self._jobs[name]["next_at"] = 0.0
+        self._wake.set()
+
+    def _run_job(self, name, job):
+        try:
+            value = job["fn"]()
+            self._values[name] = value
+            self.updated_at[name] = time.time()
+            self.errors.pop(name, None)
+            job["next_at"] = time.time() + job["interval"]
+        except Exception as e:
+            self.errors[name] = e
+            job["next_at"] = time.time() + job["retry"]
+        finally:
+            self._ready[name].set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            with self._lock:
+                due = [(n, j) for n, j in self._jobs.items() if j["next_at"] <= time.time()]
+            for name, job in due:
+                if self._stop.is_set():
+                    break
+                self._run_job(name, job)
+            with self._lock:
+                next_at = min((j["next_at"] for j in self._jobs.values()), default=time.time() + self.tick)
+            self._wake.wait(max(0.0, min(next_at - time.time(), self.tick)))
+            self._wake.clear()
+
+    def get(self, name, default=None, timeout=None):
+        """현재 값 - 첫 실행 전이면 timeout까지만 대기, 값이 없으면 default"""
+        ready = self._ready.get(name)
+        if ready is not None and not ready.is_set():
+            ready.wait(timeout)
+        return self._values.get(name, default)
+
+# [환율] USD·JPY(100엔) 원화 환율 + 전일 환율 - (usd, jpy, usd_prev, jpy_prev, rate_date)
+EXCHANGE_RATE_URL = "https://api.exchangerate-api.com/v4/latest/USD"
+PREV_RATE_URL = "https://api.frankfurter.app/{date}?from=USD&to=KRW,JPY"
+
+def _get_json(url, timeout):
+    resp = http_session().get(url, timeout=timeout)
+    resp.raise_for_status()
+    return resp.json()
+
+def fetch_exchange_rates(timeout=5, prev_timeout=3):
+    """현재 환율(exchangerate-api)과 전일 환율(Frankfurter)을 동시에 조회 - 현재 환율 실패 시 예외"""
+    yesterday = time.strftime("%Y-%m-%d", time.gmtime(time.time() - 86400))
+    pool = io_executor()
+    cur = pool.submit(_get_json, EXCHANGE_RATE_URL, timeout)
+    prev = pool.submit(_get_json, PREV_RATE_URL.format(date=yesterday), prev_timeout)
+    data = cur.result()
+    usd = float(data['rates']['KRW'])
+    jpy = (float(data['rates']['KRW']) / float(data['rates']['JPY'])) * 100
+    usd_prev, jpy_prev = usd, jpy  # 전일 환율 실패 시 보합 처리
+    try:
+        h = prev.result()
+        if h.get('rates'):
+            usd_prev = float(h['rates'].get('KRW', usd))
+            jpy_prev = (float(h['rates'].get('KRW', usd)) / float(h['rates'].get('JPY', 150))) * 100
+    except Exception:
+        pass
+    return usd, jpy, usd_prev, jpy_prev, data.get('date', '')
+
+class RatesStore:
+    """마지막 정상 환율 디스크 보관 (JSON) - 재시작·조회 실패 시에도 실제 최근 환율 즉시 사용.
+    shared(SharedCache) 지정 시 같은 cache_dir의 레플리카 중 임대를 얻은 하나만 조회"""
+
+    def __init__(self, cache_dir=None, shared=None):
+        self.path = (Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR) / "rates.json"
+        self.shared = shared
+
+    def save(self, rates, fetched_at=None):
+        fetched_at = fetched_at or time.time()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        body = json.dumps({"rates": list(rates), "fetched_at": fetched_at}, ensure_ascii=False)
+        _write_atomic(self.path, lambda p: p.write_text(body, encoding="utf-8"))
+        return tuple(rates), fetched_at
+
+    def load(self):
+        """(rates, fetched_at) 또는 None"""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            return tuple(data["rates"]), float(data["fetched_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def fetch(self, max_age=None, wait=15):
+        """새로 조회해 저장 - (rates, fetched_at). 실패 시 예외 (저장된 값은 그대로).
+        저장된 값이 max_age초 이내면 조회 없이 반환 (다른 레플리카가 방금 조회), 다른 레플리카가 조회 중이면 최대 wait초 대기"""
+        stored = self.load()
+        if max_age and stored and time.time() - stored[1] < max_age:
+            return stored
+        if self.shared is None:
+            return self.save(fetch_exchange_rates())
+        if not self.shared.claim("rates", str(self.path), wait):
+            deadline = time.time() + wait
+            while time.time() < deadline:
+                time.sleep(0.2)
+                new = self.load()
+                if new and (not stored or new[1] > stored[1]):
+                    return new
+            raise TimeoutError("rates refresh in progress elsewhere")
+        try:
+            return self.save(fetch_exchange_rates())
+        finally:
+            self.shared.release("rates", str(self.path))
+
+def _get_date_cols(df):
+    """시세 주차/날짜 컬럼 탐지 - 12월4주, 1월1주, W1, 1주, 가격 등"""
+    skip_keywords = ['키워드', 'keyword', '모델명', '상세스펙', '분류', '브랜드', '해외', 'usd', '비고', '메모', '링크', 'url']
+    c_lower = lambda s: str(s).lower().strip()
+    patterns = ['월', '주', 'week', 'date', '날짜', '주차', 'w1', 'w2', 'w3', 'w4', 'w5', '가격', 'price', '1주', '2주', '3주', '4주', '5주']
+    date_cols = [c for c in df.columns if not any(sk in c_lower(c) for sk in skip_keywords)
+                 and any(p in c_lower(c) for p in patterns)]
+    if not date_cols and len(df.columns) >= 2:
+        date_cols = list(df.columns[1:])
+    return sorted(date_cols, key=lambda x: str(x)) if date_cols else list(df.columns[1:6]) if len(df.columns) >= 2 else ["12월4주", "1월1주", "1월2주", "1월3주", "1월4주"]
+
+def _get_col(row, *names):
+    """컬럼명 유연 매칭 (공백/대소문자 무시)"""
+    import pandas as pd
+    for n in names:
+        v = row.get(n, None)
+        if pd.notna(v) and str(v).strip():
+            return str(v).strip()
+    for c in row.index:
+        c_low = str(c).lower()
+        if any(x in c_low for x in ['모델', '키워드', '제품', '상품', '이름', '품목', 'keyword', 'product', 'name', 'leica', '라이카']):
+            v = row.get(c, None)
+            if pd.notna(v) and str(v).strip() and str(v).lower() != 'nan':
+                return str(v).strip()
+    if len(row) >= 1:
+        v = row.iloc[0]
+        if pd.notna(v) and str(v).strip() and str(v).lower() != 'nan' and not re.match(r'^[\d\s,.;]+$', str(v)):
+            return str(v).strip()
+    return ''
+
+def _get_usd_val(row):
+    """해외평균 USD 값"""
+    import pandas as pd
+    for col in ['해외평균(USD)', '해외평균(usd)', '해외평균', 'usd', 'global_usd', '해외가격']:
+        v = row.get(col, None)
+        if pd.notna(v):
+            clean = re.sub(r'[^0-9.]', '', str(v))
+            if clean:
+                try:
+                    return float(clean)
+                except ValueError:
+                    pass
+    return 0.0
+
+_KO_EN_BRANDS = [("스타일러", "styler"), ("스탠바이미", "stanbyme"), ("라이카", "leica"), ("아이폰", "iphone"),
+                 ("나이키", "nike"), ("갤럭시", "galaxy"), ("맥북", "macbook"), ("소니", "sony"), ("니콘", "nikon"),
+                 ("캐논", "canon"), ("후지", "fuji"), ("올림푸스", "olympus"), ("파나소닉", "panasonic")]
+
+def _normalize_for_match(s):
+    """한·영 상품명 정규화 - 매칭용"""
+    s = str(s).lower().replace(" ", "").strip()
+    for ko, en in _KO_EN_BRANDS:
+        s = s.replace(ko, en)
+    return s
+
+def _extract_numbers(s):
+    """문자열에서 숫자 시퀀스 추출 (모델번호 매칭용)"""
+    return set(re.findall(r'\d+', str(s)))
+
+def _extract_model_tokens(s):
+    """모델 식별자 추출 (M3, Q3, M6 등) - M3≠Q3 구분용"""
+    s = str(s).lower().replace(" ", "")
+    tokens = set()
+    for m in re.finditer(r'([a-z])(\d+)\b', s):
+        tokens.add(m.group(1) + m.group(2))
+    return tokens
+
+_KEYWORD_NAME_HINTS = ['모델', '키워드', '제품', '상품', '이름', '품목', 'keyword', 'product', 'name', 'leica', '라이카']
+_RAW_PRICE_COLS = ['시세 (5주치)', '시세(5주치)', 'prices_raw', '거래가목록', '시세', '가격목록', '거래가', '가격']
+_NUMERIC_ONLY = r'^[\d\s,.;]+$'
+
+def _first_valid(df, picks):
+    """(컬럼, 조건) 우선순위대로 행마다 처음 만족하는 셀 값 선택 - _get_col 류 행 단위 탐색의 벡터화 버전"""
+    import pandas as pd
+    out = pd.Series([None] * len(df), index=df.index, dtype=object)
+    for col, cond in picks:
+        s = df[col]
+        notna = s.notna()
+        text = s.astype(str).where(notna, '')
+        mask = notna & cond(text) & out.isna()
+        if mask.any():
+            out[mask] = text[mask].str.strip()
+    return out.fillna('')
+
+def _sheet_keywords_column(df, any_cell=True):
+    """행별 매칭용 키워드 (모델명/키워드 컬럼 → 이름류 컬럼 → 숫자 아닌 첫 셀, any_cell=False면 첫 컬럼만)"""
+    nonblank = lambda t: t.str.strip() != ''
+    not_nan = lambda t: nonblank(t) & (t.str.lower() != 'nan')
+    not_num = lambda t: not_nan(t) & ~t.str.match(_NUMERIC_ONLY)
+    picks = [(c, nonblank) for c in ['모델명', '키워드', 'keyword'] if c in df.columns]
+    picks += [(c, not_nan) for c in df.columns if any(x in str(c).lower() for x in _KEYWORD_NAME_HINTS)]
+    picks += [(c, not_num) for c in (df.columns if any_cell else df.columns[:1])]
+    return _first_valid(df, picks)
+
+SHEET_KEYWORD_COLS = ['모델명', '키워드', 'keyword', '제품명', '상품명', '상품', '이름', '품목', 'name', 'product']
+
+def extract_sheet_keywords(df):
+    """
+    검색 가능한 시트 키워드 (짧은 순 정렬 tuple) - 키워드/이름류 컬럼만 검사, 없으면 첫 컬럼의 숫자 아닌 값
+    """
+    if df is None or df.empty:
+        return ()
+    cols = [c for c in SHEET_KEYWORD_COLS if c in df.columns]
+    cols += [c for c in df.columns if c not in cols and any(x in str(c).lower() for x in _KEYWORD_NAME_HINTS)]
+    named = bool(cols)  # 이름 컬럼 값은 숫자 모델명(예: 501)도 허용
+    keywords = set()
+    for col in cols or df.columns[:1]:
+        s = df[col].dropna().astype(str).str.strip()
+        ok = (s.str.len() >= 2) & (s.str.lower() != 'nan')
+        if not named:
+            ok &= ~s.str.match(_NUMERIC_ONLY)
+        keywords.update(s[ok].tolist())
+    return tuple(sorted(keywords, key=lambda x: (len(x), x)))
+
+def _sheet_raw_price_column(df):
+    """행별 시세 원본 문자열 - 시세(5주치), prices_raw, 거래가목록 등 → 없으면 쉼표로 구분된 숫자 셀"""
+    not_nan = lambda t: (t.str.strip() != '') & (t.str.lower() != 'nan')
+    listed = lambda t: t.str.contains(',', regex=False) & (t.str.count(r'\d+') >= 2)
+    picks = [(c, not_nan) for c in _RAW_PRICE_COLS if c in df.columns]
+    picks += [(c, listed) for c in df.columns]
+    return _first_valid(df, picks)
+
+def _parse_price_cells(cells):
+    """시세 문자열 배열 일괄 파싱 ("95, 93; 92" → 95, 93, 92) → (양수 가격 평탄 배열, 셀별 개수)"""
+    import numpy as np
+    import pandas as pd
+    n = len(cells)
+    if n == 0:
+        return np.empty(0, dtype=np.float64), np.zeros(0, dtype=np.int64)
+    parts = pd.Series(cells, dtype=object).str.replace(';', ',', regex=False).str.split(',').explode()
+    clean = parts.str.replace(r'[^0-9.]', '', regex=True)
+    vals = pd.to_numeric(clean.where(clean != ''), errors='coerce')
+    vals = vals[vals.notna() & (vals > 0)]
+    counts = np.bincount(vals.index.to_numpy(dtype=np.int64), minlength=n)
+    return vals.to_numpy(dtype=np.float64), counts
+
+class PriceMatrix:
+    """
+    시트 전체 시세를 로드 시 1회 파싱한 컬럼형(ragged) 구조.
+    values: 전체 가격 float64 평탄 배열 / offsets: 셀 경계 (행 × (주차 + raw))
+    행 r의 주차 w 가격 = values[offsets[r*S+w]:offsets[r*S+w+1]] (S = 주차 수 + 1, 마지막 슬롯은 시세(5주치) 등 raw)
+    """
+
+    def __init__(self, df, date_cols=None):
+        import numpy as np
+        self.n_rows = 0 if df is None else len(df)
+        if date_cols is None:
+            date_cols = _get_date_cols(df) if self.n_rows else []
+        self.weeks = [c for c in date_cols if df is not None and c in df.columns]
+        self.stride = len(self.weeks) + 1
+        slots = []
+        for col in self.weeks:
+            s = df[col]
+            text = s.astype(str).str.strip().where(s.notna(), '')
+            slots.append(text.where(text.str.lower() != 'nan', '').to_numpy(dtype=object))
+        slots.append(_sheet_raw_price_column(df).to_numpy(dtype=object) if self.n_rows else np.empty(0, dtype=object))
+        cells = np.column_stack(slots).ravel() if self.n_rows else np.empty(0, dtype=object)
+        self.values, counts = _parse_price_cells(cells)
+        self.offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        self.counts = counts
+        # 주차별 평균 (전체시세) - 셀 순서대로 합산해 sum(p) / len(p)와 동일
+        cell_ids = np.repeat(np.arange(len(counts)), counts)
+        sums = np.bincount(cell_ids, weights=self.values, minlength=len(counts))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.cell_means = sums / counts
+
+    def __len__(self):
+        return self.n_rows
+
+    _ARRAYS = ("values", "offsets", "counts", "cell_means")
+
+    def write_arrow(self, path, version=None):
+        """Arrow IPC(Feather v2, 무압축) 1행 테이블로 저장 - 배열마다 list 컬럼 1개, 주차·행 수·시트 버전은 스키마 메타데이터"""
+        import numpy as np
+        import pyarrow as pa
+        from pyarrow import feather
+        cols = {}
+        for name in self._ARRAYS:
+            a = np.ascontiguousarray(getattr(self, name))
+            cols[name] = pa.ListArray.from_arrays(pa.array([0, len(a)], pa.int32()), pa.array(a))
+        meta = {"weeks": [str(w) for w in self.weeks], "n_rows": self.n_rows, "version": version}
+        table = pa.table(cols).replace_schema_metadata({"radar": json.dumps(meta, ensure_ascii=False)})
+        _write_atomic(Path(path), lambda p: feather.write_feather(table, str(p), compression="uncompressed"))
+
+    @classmethod
+    def read_arrow(cls, path, version=None):
+        """write_arrow 파일 memory-map 읽기 - 배열은 매핑된 버퍼의 읽기 전용 numpy 뷰 (프로세스별 복사 없음).
+        version이 저장 당시와 다르면 None"""
+        from pyarrow import feather
+        table = feather.read_table(str(path), memory_map=True)
+        meta = json.loads(table.schema.metadata[b"radar"])
+        if version is not None and meta.get("version") != version:
+            return None
+        self = cls.__new__(cls)
+        self.n_rows, self.weeks = meta["n_rows"], meta["weeks"]
+        self.stride = len(self.weeks) + 1
+        for name in self._ARRAYS:
+            setattr(self, name, table.column(name).chunk(0).flatten().to_numpy(zero_copy_only=True))
+        return self
+
+    def has_prices(self, r):
+        return self.offsets[r * self.stride] != self.offsets[(r + 1) * self.stride]
+
+    def week_prices(self, r):
+        """[(주차 컬럼, 가격 배열)] - 시세 있는 주차만"""
+        base = r * self.stride
+        return [(col, self.values[self.offsets[base + w]:self.offsets[base + w + 1]])
+                for w, col in enumerate(self.weeks) if self.counts[base + w]]
+
+    def trend(self, r):
+        """(주차 라벨, 주차별 평균 시세)"""
+        import numpy as np
+        base = r * self.stride
+        weeks = [w for w in range(len(self.weeks)) if self.counts[base + w]]
+        return [self.weeks[w] for w in weeks], self.cell_means[base + np.array(weeks, dtype=np.int64)]
+
+    def raw_prices(self, r):
+        """주차별 시세 + 시세(5주치) 등 raw 전체"""
+        return self.values[self.offsets[r * self.stride]:self.offsets[(r + 1) * self.stride]]
+
+    def this_week(self, r):
+        """가장 최근 주차 시세 (없으면 빈 배열)"""
+        base = r * self.stride
+        for w in range(len(self.weeks) - 1, -1, -1):
+            if self.counts[base + w]:
+                return self.values[self.offsets[base + w]:self.offsets[base + w + 1]]
+        return self.values[:0]
+
+def _price_summary(p):
+    """시세요약: 중앙값 + Q1/Q3 (4건 이상이면 IQR 밖 극단값 제거) → (avg, min, max), 데이터 없으면 None"""
+    import numpy as np
+    if not len(p):
+        return None
+    if len(p) >= 4:
+        q1, q3 = np.percentile(p, [25, 75])
+        iqr = q3 - q1
+        filt = p[(p >= q1 - 1.5 * iqr) & (p <= q3 + 1.5 * iqr)]
+        p = filt if len(filt) >= 2 else p
+    if len(p) >= 4:
+        q1, q3 = np.percentile(p, [25, 75])
+        return float(np.median(p)), float(q1), float(q3)
+    return float(np.median(p)), float(p.min()), float(p.max())
+
+def _build_trend_result(row, k_val, matrix, r):
+    """매칭된 행 → 시세 결과 dict (시세 없으면 None)"""
+    # 전체시세: 주차별 가중평균(산술평균)
+    valid_dates, trend = matrix.trend(r)
+    trend_prices = trend.tolist()
+    raw = matrix.raw_prices(r)
+    if not len(raw):
+        raw = trend
+    global_usd = _get_usd_val(row)
+    if not trend_prices and len(raw):
+        trend_prices = [sum(raw.tolist()) / len(raw)]
+        valid_dates = ["시세"]
+    if not trend_prices:
+        return None
+    name = _get_col(row, '모델명', '모델명 (상세스펙/상태)')
+    spec = _get_col(row, '상세스펙')
+    if spec:
+        name = f"{name} ({spec})".strip() if name else spec
+    name = name or '상품명 미상'
+    # 시세요약: 이번주 중앙값 + Q1/Q3 (극단값 제거, 자연스러운 구간)
+    this_week_prices = matrix.this_week(r)
+    summary = _price_summary(this_week_prices if len(this_week_prices) else raw)
+    summary_avg, summary_min, summary_max = summary if summary else (trend_prices[-1], 0, 0)
+    return {
+        "name": name, "dates": valid_dates, "trend_prices": trend_prices, "raw_prices": raw.tolist(),
+        "global_usd": global_usd, "matched_keyword": k_val,
+        "summary_avg": summary_avg, "summary_min": summary_min, "summary_max": summary_max,
+        "summary_n": len(this_week_prices)
+    }
+
+def _bigrams(s):
+    return {s[i:i + 2] for i in range(len(s) - 1)}
+
+class PriceIndex:
+    """
+    시트 매칭 인덱스 - load_price_data 결과당 1회 생성.
+    행별 정규화 키워드·숫자·모델 토큰 + 일괄 파싱된 시세(PriceMatrix)를 미리 계산하고,
+    bigram/부분문자열 조회로 검색어마다 후보 행만 검사 (iterrows 전체 스캔 제거)
+    """
+    FUZZY_CUTOFF = 0.80  # SequenceMatcher: 0.80 이상만 허용 (오타 보정용, 아무거나 연동 방지)
+    MIN_LEN = 2
+
+    def __init__(self, df):
+        self.df = df
+        self.keywords = []   # 원본 키워드 (matched_keyword)
+        self.cleans = []     # 소문자·공백 제거
+        self.norms = []      # 한·영 정규화 (_normalize_for_match)
+        self.nums = []
+        self.tokens = []
+        self.positions = []  # df 행 위치 (iloc) = PriceMatrix 행 번호
+        self._clean_exact, self._norm_exact = {}, {}  # 키워드 문자열 → [entry]
+        self._clean_grams, self._norm_grams = {}, {}  # bigram → {키워드 문자열}
+        self._norm_lens = {}  # len(norm) → {norm} (짧은 키워드 오타 보정 후보)
+        self.matrix = sheet_matrix(df)
+        if self.matrix is None or len(self.matrix) != (0 if df is None else len(df)):
+            self.matrix = PriceMatrix(df)
+        if df is None or df.empty:
+            return
+        for pos, k_val in enumerate(_sheet_keywords_column(df).tolist()):
+            # 시세가 하나도 없는 행은 결과가 될 수 없으므로 인덱스에서 제외
+            if k_val and self.matrix.has_prices(pos):
+                self._add(pos, k_val)
+
+    def _add(self, pos, k_val):
+        i = len(self.keywords)
+        clean = str(k_val).lower().replace(" ", "").strip()
+        norm = _normalize_for_match(str(k_val))
+        self.keywords.append(k_val)
+        self.cleans.append(clean)
+        self.norms.append(norm)
+        self.nums.append(_extract_numbers(k_val))
+        self.tokens.append(_extract_model_tokens(k_val))
+        self.positions.append(pos)
+        if clean not in self._clean_exact:
+            for g in _bigrams(clean):
+                self._clean_grams.setdefault(g, set()).add(clean)
+        if norm not in self._norm_exact:
+            for g in _bigrams(norm):
+                self._norm_grams.setdefault(g, set()).add(norm)
+            self._norm_lens.setdefault(len(norm), set()).add(norm)
+        self._clean_exact.setdefault(clean, []).append(i)
+        self._norm_exact.setdefault(norm, []).append(i)
+
+    def __len__(self):
+        return len(self.keywords)
+
+    @staticmethod
+    def _containing(q, grams, exact):
+        """q를 부분문자열로 포함하는 항목 (q의 bigram을 전부 가진 키워드만 확인)"""
+        postings = [grams.get(g) for g in _bigrams(q)]
+        if not postings or any(p is None for p in postings):
+            return set()
+        postings.sort(key=len)
+        keys = set(postings[0])
+        for p in postings[1:]:
+            keys &= p
+            if not keys:
+                break
+        out = set()
+        for s in keys:
+            if q in s:
+                out.update(exact[s])
+        return out
+
+    @staticmethod
+    def _contained(q, exact):
+        """q의 부분문자열과 정확히 같은 항목"""
+        out = set()
+        n = len(q)
+        for i in range(n):
+            for j in range(i + 1, n + 1):
+                hit = exact.get(q[i:j])
+                if hit:
+                    out.update(hit)
+        return out
+
+    def _fuzzy(self, user_norm, exclude):
+        """오타 보정 후보 - 길이·bigram 하한으로 거른 뒤 SequenceMatcher 비율 확인"""
+        la = len(user_norm)
+        cutoff = self.FUZZY_CUTOFF
+        # ratio = 2M/(la+lb) ≥ cutoff 이려면 길이 비율이 맞아야 하고, la+lb ≥ 6이면 공통 bigram이 최소 1개 필요
+        lo = math.ceil(la * cutoff / (2 - cutoff) - 1e-9)
+        hi = math.floor(la * (2 - cutoff) / cutoff + 1e-9)
+        cands = set()
+        for g in _bigrams(user_norm):
+            cands |= self._norm_grams.get(g, set())
+        for lb in range(max(lo, 0), min(hi, 5 - la) + 1):
+            cands |= self._norm_lens.get(lb, set())
+        sm = difflib.SequenceMatcher(None, user_norm, "")
+        out = set()
+        for norm in cands:
+            if not (lo <= len(norm) <= hi):
+                continue
+            sm.set_seq2(norm)
+            if sm.real_quick_ratio() >= cutoff and sm.quick_ratio() >= cutoff and sm.ratio() >= cutoff:
+                out.update(i for i in self._norm_exact[norm] if i not in exclude and len(self.cleans[i]) >= self.MIN_LEN)
+        return out
+
+    @staticmethod
+    def query_key(user_query):
+        """결과를 결정하는 정규화 검색어 키 - 같은 키면 lookup 결과가 같음 (소문자·공백 제거 + 숫자 집합)"""
+        # 숫자는 정렬된 tuple - set/frozenset repr 순서는 PYTHONHASHSEED마다 달라 프로세스 간 공유 키로 못 씀
+        return str(user_query).lower().replace(" ", "").strip(), tuple(sorted(set(_extract_numbers(user_query))))
+
+    def lookup(self, user_query):
+        """검색어와 가장 비슷한 시트 행의 시세 결과 (없으면 None)"""
+        return self._lookup(user_query, {})
+
+    def lookup_many(self, queries):
+        """여러 검색어 일괄 조회 - 검색어별 _lookup 루프 (한 번에 벡터화하는 방식 아님).
+        인덱스 1회 빌드 공유 + 같은 정규화 검색어·같은 결과 행은 배치 안에서 한 번만 계산"""
+        row_results, by_key, out = {}, {}, []
+        for q in queries:
+            key = self.query_key(q) if q else None
+            if key not in by_key:
+                by_key[key] = self._lookup(q, row_results) if q else None
+            out.append(by_key[key])
+        return out
+
+    def _row_result(self, i, cache):
+        if i not in cache:
+            try:
+                pos = self.positions[i]
+                cache[i] = _build_trend_result(self.df.iloc[pos], self.keywords[i], self.matrix, pos)
+            except Exception:
+                cache[i] = None
+        return cache[i]
+
+    def _lookup(self, user_query, row_results):
+        if not self.keywords or not user_query:
+            return None
+        user_clean = user_query.lower().replace(" ", "").strip()
+        if len(user_clean) < self.MIN_LEN:
+            return None
+        user_norm = _normalize_for_match(user_query)
+        user_nums = _extract_numbers(user_query)
+        user_tokens = _extract_model_tokens(user_query)
+        # [엄격 매칭] 모델명/키워드 컬럼만 사용 - 다른 셀 스캔 제거 (잘못된 연동 방지)
+        matched = (self._containing(user_clean, self._clean_grams, self._clean_exact) |
+                   self._contained(user_clean, self._clean_exact) |
+                   self._containing(user_norm, self._norm_grams, self._norm_exact) |
+                   self._contained(user_norm, self._norm_exact))
+        matched |= self._fuzzy(user_norm, matched)
+        best = None
+        for i in sorted(matched):
+            # [정확도] 숫자(모델번호)가 있으면 반드시 일치 - 아이폰15≠아이폰17프로
+            if user_nums and self.nums[i] and not (user_nums & self.nums[i]):
+                continue
+            # [정확도] 모델 식별자(M3, Q3, M6 등)가 있으면 반드시 일치 - M3≠Q3
+            if user_tokens and self.tokens[i] and not (user_tokens & self.tokens[i]):
+                continue
+            # 검색어와 길이 차이 최소화 - 아이폰15프로 검색→아이폰15프로, 아이폰15→아이폰15
+            key = (abs(len(user_clean) - len(self.cleans[i])), 0 if user_clean == self.cleans[i] else 1)
+            if best is not None and key >= best[0]:
+                continue
+            result = self._row_result(i, row_results)
+            if result is not None:
+                best = (key, result)
+        return best[1] if best else None
+
+
+SHEET_CATEGORY_COLS = ['분류', 'category', '카테고리']
+SHEET_CATEGORIES = ('CAMERA', 'FASHION', 'TECH', 'LIVING', 'GAME')
+
+class CategoryIndex:
+    """
+    시트 '분류' 컬럼 조회표 - 정규화 키워드 → (첫 행 번호, 분류).
+    완전/부분 일치는 사전 조회, 유사도(>0.6) 비교는 더 앞선 행의 공통 글자 후보에만 수행
+    """
+    FUZZY_CUTOFF = 0.6
+
+    def __init__(self, df, memo_size=4096):
+        self.tables = []  # 분류 컬럼 우선순위별 {키워드: (행 번호, 분류)}
+        if df is not None and not df.empty:
+            cols = [c for c in SHEET_CATEGORY_COLS if c in df.columns]
+            keywords = _sheet_keywords_column(df, any_cell=False).str.lower().str.replace(" ", "", regex=False).str.strip() if cols else None
+            for col in cols:
+                cats = df[col].astype(str).str.strip().str.upper().where(df[col].notna(), '')
+                table = {}
+                for pos, (kw, cat) in enumerate(zip(keywords.tolist(), cats.tolist())):
+                    if len(kw) >= 2 and cat in SHEET_CATEGORIES and kw not in table:
+                        table[kw] = (pos, cat)
+                chars = {}
+                for kw in table:
+                    for ch in set(kw):
+                        chars.setdefault(ch, set()).add(kw)
+                self.tables.append((table, chars))
+        self.lookup = functools.lru_cache(maxsize=memo_size)(self._lookup)
+
+    def _lookup(self, keyword):
+        """시트 분류 (CAMERA/FASHION/TECH/LIVING/GAME) 또는 None - 매칭되는 가장 앞 행 기준"""
+        if not self.tables or not keyword or len(str(keyword).strip()) < 2:
+            return None
+        user_clean = str(keyword).lower().replace(" ", "").strip()
+        n = len(user_clean)
+        subs = {user_clean[i:j] for i in range(n) for j in range(i + 1, n + 1)}
+        for table, chars in self.tables:
+            best = None
+            for s in subs:  # 시트 키워드 ⊂ 검색어
+                hit = table.get(s)
+                if hit and (best is None or hit[0] < best[0]):
+                    best = hit
+            cands = set()
+            for ch in set(user_clean):
+                cands |= chars.get(ch, set())
+            sm = difflib.SequenceMatcher(None, user_clean, "")
+            for kw in cands:  # 검색어 ⊂ 시트 키워드, 또는 유사도 > 0.6 (공통 글자 없으면 유사도 0)
+                pos_cat = table[kw]
+                if best is not None and pos_cat[0] >= best[0]:
+                    continue
+                if user_clean in kw:
+                    best = pos_cat
+                    continue
+                sm.set_seq2(kw)
+                if sm.real_quick_ratio() > self.FUZZY_CUTOFF and sm.quick_ratio() > self.FUZZY_CUTOFF and sm.ratio() > self.FUZZY_CUTOFF:
+                    best = pos_cat
+            if best is not None:
+                return best[1]
+        return None
+
+def _keyword_norm(s):
+    """추천/자동완성 비교용 정규화 - 소문자·공백 제거"""
+    return str(s).lower().replace(" ", "")
+
+class KeywordIndex:
+    """
+    자동완성·유사 검색어 인덱스 - 키워드 풀(시트 + 빌보드)당 1회 생성.
+    정렬된 정규화 배열(접두어 = 평탄화 trie), 3-gram 역색인(부분 문자열), 글자 빈도 역색인(유사도 후보)으로
+    풀 전체 difflib.get_close_matches 스캔 없이 같은 결과를 반환
+    """
+
+    def __init__(self, keywords, groups=None):
+        import numpy as np
+        self.keywords = list(keywords)  # 노출 우선순위 순 (시트 우선·짧은 순)
+        self.norms = [_keyword_norm(k) for k in self.keywords]
+        ids, self._members = {}, []  # 정규화 문자열 → 고유 id, 고유 id → 키워드 위치들
+        for pos, n in enumerate(self.norms):
+            if n not in ids:
+                ids[n] = len(self._members)
+                self._members.append([])
+            self._members[ids[n]].append(pos)
+        self._ids = ids
+        self._uniq = list(ids)
+        self._uid = np.array([ids[n] for n in self.norms], dtype=np.int64)
+        self._mult = np.array([len(m) for m in self._members], dtype=np.int64)
+        self._lens = np.array([len(n) for n in self._uniq], dtype=np.int64)
+        self._sorted = sorted(self._uniq)
+        chars, self._grams = {}, {}
+        for u, n in enumerate(self._uniq):
+            for ch in set(n):
+                chars.setdefault(ch, ([], []))
+                chars[ch][0].append(u)
+                chars[ch][1].append(n.count(ch))
+            for g in {n[i:i + 3] for i in range(len(n) - 2)}:
+                self._grams.setdefault(g, set()).add(u)
+        self._chars = {ch: (np.array(us, dtype=np.int64), np.array(cs, dtype=np.int64)) for ch, (us, cs) in chars.items()}
+        self.groups = {}
+        for name, words in (groups or {}).items():
+            words = set(words)
+            self.groups[name] = np.fromiter((k in words for k in self.keywords), dtype=bool, count=len(self.keywords))
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def mask(self, *names):
+        """이름 붙은 그룹들의 합집합 (허용 키워드 마스크) - 없는 그룹은 무시"""
+        import numpy as np
+        out = np.zeros(len(self.keywords), dtype=bool)
+        for name in names:
+            if name in self.groups:
+                out |= self.groups[name]
+        return out
+
+    def _positions(self, uids, allowed=None):
+        pos = sorted(p for u in uids for p in self._members[u])
+        return pos if allowed is None else [p for p in pos if allowed[p]]
+
+    def prefix(self, prefix, k=10, allowed=None):
+        """정규화 접두어로 시작하는 키워드 상위 k개 (노출 우선순위 순)"""
+        p = _keyword_norm(prefix)
+        lo = bisect.bisect_left(self._sorted, p)
+        uids = []
+        for n in self._sorted[lo:]:
+            if not n.startswith(p):
+                break
+            uids.append(self._ids[n])
+        return [self.keywords[i] for i in self._positions(uids, allowed)[:k]]
+
+    def similar(self, word, n=5, cutoff=0.6, allowed=None):
+        """
+        difflib.get_close_matches(word, [정규화 풀], n, cutoff)와 같은 결과 (중복 키워드 포함).
+        공통 글자 수 상한(quick_ratio)을 역색인으로 한 번에 계산해 통과한 후보만 ratio 비교
+        """
+        import numpy as np
+        if not word or not len(self._uniq):
+            return []
+        mult = self._mult if allowed is None else np.bincount(self._uid[allowed], minlength=len(self._uniq))
+        common = np.zeros(len(self._uniq), dtype=np.int64)
+        for ch in set(word):
+            hit = self._chars.get(ch)
+            if hit is not None:
+                common[hit[0]] += np.minimum(hit[1], word.count(ch))
+        bound = 2.0 * common / (len(word) + self._lens)
+        sm = difflib.SequenceMatcher()
+        sm.set_seq2(word)
+        result = []
+        for u in np.flatnonzero((bound >= cutoff) & (mult > 0)).tolist():
+            sm.set_seq1(self._uniq[u])
+            r = sm.ratio()
+            if r >= cutoff:
+                result.extend([(r, self._uniq[u])] * int(mult[u]))
+        return [x for _, x in heapq.nlargest(n, result)]
+
+    def _containing(self, v):
+        """정규화 키워드 중 v를 포함하는 것 (3-gram 교집합 후 확인)"""
+        if len(v) >= 3:
+            sets = sorted((self._grams.get(v[i:i + 3], set()) for i in range(len(v) - 2)), key=len)
+            cands = set.intersection(*sets) if sets[0] else set()
+        else:
+            cands = set(self._chars[v[0]][0].tolist()) if v[0] in self._chars else set()
+        return {u for u in cands if v in self._uniq[u]}
+
+    def related(self, query, k=3, n=5, cutoff=0.6, allowed=None):
+        """
+        유사 검색어 상위 k개 - 검색어 + 유사 키워드 n개 중 하나를 포함하거나 그 안에 포함되는 키워드 (노출 우선순위 순)
+        """
+        q = _keyword_norm(query).strip()
+        if not q:
+            return []
+        uids = set()
+        for v in {q} | set(self.similar(q, n, cutoff, allowed)):
+            uids |= self._containing(v)
+            subs = {v[i:j] for i in range(len(v) + 1) for j in range(i, len(v) + 1)}
+            uids |= {self._ids[s] for s in subs if s in self._ids}
+        return [self.keywords[i] for i in self._positions(uids, allowed)[:k]]
+
+# ------------------------------------------------------------------
+# [번역] 검색어 한→영/일 - 로컬 사전 → 디스크(SQLite) 캐시 → 번역 API 순
+# ------------------------------------------------------------------
+TRANSLATE_URL = "https://translate.googleapis.com/translate_a/single?client=gtx&sl=ko&tl={lang}&dt=t&q={q}"
+_HANGUL = re.compile('[가-힣]')
+
+# 한글 첫 자음(초성 19개 순서) → 음차 시 올 수 있는 영문 첫 글자
+_CHOSEONG_LATIN = ["gkcq", "kgc", "n", "dt", "dt", "rl", "m", "bvp", "bp", "sczxt", "s", "aeiouyhwx", "jgzc", "jz",
+                   "c", "kcq", "t", "pf", "hw"]
+
+def _sounds_alike(ko_word, en_word):
+    """음차 표기 첫소리 비교 - '노스페이스'↔'Stone' 같은 어긋난 쌍 제외"""
+    if not ko_word or not en_word or not '가' <= ko_word[0] <= '힣':
+        return False
+    return en_word[0].lower() in _CHOSEONG_LATIN[(ord(ko_word[0]) - 0xAC00) // 588]
+
+def _lexicon_pair_ok(ko, en):
+    """(한글 표기, 영문 표기)가 같은 상품인지 - 한글 쪽 영숫자 단어 ⊂ 영문 단어, 숫자 동일, 첫 한글 단어 첫소리 일치"""
+    if not _HANGUL.search(ko) or _HANGUL.search(en) or not re.search('[A-Za-z]', en):
+        return False
+    ko_words = set(re.findall(r'[a-z0-9]+', ko.lower()))
+    en_words = set(re.findall(r'[a-z0-9]+', en.lower()))
+    if len(en.split()) > len(ko.split()) + 1:  # 'Steam Deck OLED' ↔ '스팀덱' 같은 세부 모델명 제외
+        return False
+    if not ko_words <= en_words or sorted(re.findall(r'\d+', ko)) != sorted(re.findall(r'\d+', en)):
+        return False
+    first_ko = next((w for w in ko.split() if _HANGUL.search(w)), "")
+    first_en = next((w for w in en.split() if w.lower() not in ko_words), "")
+    return _sounds_alike(first_ko, first_en)
+
+class Lexicon:
+    """
+    한→영 상품명 사전 - 브랜드 쌍, (영문, 한글) 순서로 나열된 풀 항목, 시트 행의 한·영 키워드 컬럼에서 수집.
+    단어 수가 같은 쌍은 단어 단위로도 등록해 '나이키 덩크' 같은 조합도 번역 (뜻이 갈리는 단어는 제외)
+    """
+
+    def __init__(self, pools=(), df=None):
+        self.phrases = {}
+        words, conflicts = {}, set()
+        for ko, en in self._pairs(pools, df):
+            self.phrases.setdefault(ko, en)
+            ko_w, en_w = ko.split(), en.split()
+            if len(ko_w) != len(en_w):
+                continue
+            for k, e in zip(ko_w, en_w):
+                if not _HANGUL.search(k):
+                    if k.lower() != e.lower():
+                        break
+                    continue
+                if not _sounds_alike(k, e):
+                    continue
+                if words.get(k, e).lower() != e.lower():
+                    conflicts.add(k)
+                words.setdefault(k, e)
+        for ko, en in _KO_EN_BRANDS:  # 풀에 없는 브랜드만 (소문자 표기)
+            words.setdefault(ko, en)
+        for k, e in words.items():
+            if k not in conflicts:
+                self.phrases.setdefault(k, e)
+        self.max_words = max((len(k.split()) for k in self.phrases), default=1)
+
+    @staticmethod
+    def _pairs(pools, df):
+        for pool in pools:
+            for en, ko in zip(pool, pool[1:]):
+                if _lexicon_pair_ok(ko, en):
+                    yield " ".join(ko.split()), " ".join(en.split())
+        if df is not None and not df.empty:
+            cols = [c for c in SHEET_KEYWORD_COLS if c in df.columns]
+            for row in df[cols].itertuples(index=False) if len(cols) > 1 else ():
+                cells = [str(v).strip() for v in row if isinstance(v, str) and v.strip()]
+                for ko in cells:
+                    for en in cells:
+                        if _lexicon_pair_ok(ko, en):
+                            yield " ".join(ko.split()), " ".join(en.split())
+
+    def __len__(self):
+        return len(self.phrases)
+
+    def translate(self, text):
+        """가장 긴 구절부터 치환 - 한글이 하나도 남지 않으면 번역 결과, 남으면 None"""
+        tokens, out, i = str(text).split(), [], 0
+        while i < len(tokens):
+            for n in range(min(self.max_words, len(tokens) - i), 0, -1):
+                hit = self.phrases.get(" ".join(tokens[i:i + n]))
+                if hit is not None:
+                    out.append(hit)
+                    i += n
+                    break
+            else:
+                if _HANGUL.search(tokens[i]):
+                    return None
+                out.append(tokens[i])
+                i += 1
+        return " ".join(out) if out else None
+
+class _SqliteStore:
+    """SQLite(WAL) 파일 캐시 - 프로세스·재시작 간 공유. 스레드별 연결, 첫 연결 시 _SCHEMA 생성"""
+    _SCHEMA = ""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.execute(self._SCHEMA)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            import sqlite3
+            conn = sqlite3.connect(str(self.path), timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+class TranslationStore(_SqliteStore):
+    """번역 결과 디스크 캐시 (SQLite, WAL) - 프로세스·재시작 간 공유. 스레드별 연결"""
+    _SCHEMA = ("CREATE TABLE IF NOT EXISTS translations (src TEXT NOT NULL, lang TEXT NOT NULL, "
+               "dst TEXT NOT NULL, updated_at REAL NOT NULL, PRIMARY KEY (src, lang))")
+
+    def __init__(self, path=None):
+        super().__init__(path or DEFAULT_CACHE_DIR / "translations.sqlite")
+
+    def get(self, text, lang):
+        row = self._conn().execute("SELECT dst FROM translations WHERE src = ? AND lang = ?", (text, lang)).fetchone()
+        return row[0] if row else None
+
+    def put(self, text, lang, dst):
+        with self._conn() as conn:
+            conn.execute("INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?)", (text, lang, dst, time.time()))
+
+    def __len__(self):
+        return self._conn().execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+# [공유 캐시] 레플리카 간 공유 결과 캐시 - memory(기본, 프로세스 내) / file / sqlite (같은 호스트의 cache_dir 공유)
+class SharedCache:
+    """
+    공유 캐시 백엔드 공통 - (네임스페이스, 키) → 값 (pickle 가능), 만료 시각(ttl).
+    키는 정규 JSON으로 직렬화 (_key_text: set은 정렬 목록, dict는 키 정렬) → 프로세스·해시 시드가 달라도 같은 키.
+    claim/release: 짧은 임대(lease) - 여러 레플리카 중 하나만 원본 조회 (나머지는 그 결과를 읽음)
+    """
+    MISSING = object()
+    cross_process = False
+
+    @staticmethod
+    def _key_text(key):
+        return json.dumps(key, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=sorted)
+
+    def get_or_compute(self, ns, key, compute, ttl=None):
+        """저장된 값 또는 compute() 결과 저장 후 반환 - 백엔드 오류는 무시하고 계산만"""
+        try:
+            value = self.get(ns, key, self.MISSING)
+        except Exception:
+            value = self.MISSING
+        if value is self.MISSING:
+            value = compute()
+            try:
+                self.put(ns, key, value, ttl)
+            except Exception:
+                pass
+        return value
+
+class MemoryCache(SharedCache):
+    """프로세스 내 공유 캐시 (기본) - 최대 maxsize개, 오래된 것부터 축출. 임대도 프로세스 안에서만 유효"""
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self._data = OrderedDict()  # (ns, key) → (expires_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, ns, key, default=None):
+        k = (ns, self._key_text(key))
+        with self._lock:
+            hit = self._data.get(k)
+            if hit is None or (hit[0] is not None and hit[0] < time.time()):
+                return default
+            self._data.move_to_end(k)
+            return hit[1]
+
+    def put(self, ns, key, value, ttl=None):
+        k = (ns, self._key_text(key))
+        with self._lock:
+            self._data[k] = (time.time() + ttl if ttl else None, value)
+            self._data.move_to_end(k)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def claim(self, ns, key, ttl):
+        with self._lock:
+            k = ("lease:" + ns, self._key_text(key))
+            hit = self._data.get(k)
+            if hit is not None and hit[0] >= time.time():
+                return False
+            self._data[k] = (time.time() + ttl, True)
+            return True
+
+    def release(self, ns, key):
+        with self._lock:
+            self._data.pop(("lease:" + ns, self._key_text(key)), None)
+
+class FileCache(SharedCache):
+    """파일 공유 캐시 - <root>/<ns>/<키 해시>.pkl (원자적 교체), 임대는 O_EXCL 잠금 파일. prune_every번 저장마다 만료 파일 정리"""
+    cross_process = True
+
+    def __init__(self, root, prune_every=500):
+        self.root = Path(root)
+        self.prune_every, self._puts = prune_every, 0
+
+    def _path(self, ns, key, ext=".pkl"):
+        return self.root / ns / (hashlib.sha1(self._key_text(key).encode()).hexdigest()[:24] + ext)
+
+    def get(self, ns, key, default=None):
+        import pickle
+        try:
+            with open(self._path(ns, key), "rb") as f:
+                expires_at, stored_key, value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return default
+        if stored_key != self._key_text(key) or (expires_at is not None and expires_at < time.time()):
+            return default
+        return value
+
+    def put(self, ns, key, value, ttl=None):
+        import pickle
+        path = self._path(ns, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        expires_at = time.time() + ttl if ttl else None
+        body = pickle.dumps((expires_at, self._key_text(key), value), protocol=pickle.HIGHEST_PROTOCOL)
+        _write_atomic(path, lambda p: p.write_bytes(body))
+        self._puts += 1
+        if self._puts % self.prune_every == 0:
+            self.prune()
+
+    def prune(self):
+        """만료된 값 파일 삭제 (만료 없는 값은 유지)"""
+        import pickle
+        for path in self.root.glob("*/*.pkl"):
+            try:
+                with open(path, "rb") as f:
+                    expires_at = pickle.load(f)[0]
+                if expires_at is not None and expires_at < time.time():
+                    path.unlink()
+            except (OSError, EOFError, pickle.UnpicklingError, IndexError, TypeError):
+                pass
+
+    def claim(self, ns, key, ttl):
+        path = self._path("lease-" + ns, key, ".lock")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        for _ in range(2):
+            try:
+                os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return True
+            except FileExistsError:
+                try:
+                    if path.stat().st_mtime + ttl >= time.time():
+                        return False
+                    path.unlink()  # 임대한 프로세스가 죽은 경우 - 만료된 잠금 회수
+                except FileNotFoundError:
+                    pass
+        return False
+
+    def release(self, ns, key):
+        try:
+            self._path("lease-" + ns, key, ".lock").unlink()
+        except FileNotFoundError:
+            pass
+
+class SqliteCache(_SqliteStore, SharedCache):
+    """SQLite(WAL) 공유 캐시 - 값은 pickle BLOB, 임대는 만료된 행만 덮어쓰는 upsert. prune_every번 저장마다 만료 행 삭제"""
+    _SCHEMA = ("CREATE TABLE IF NOT EXISTS cache (ns TEXT NOT NULL, k TEXT NOT NULL, v BLOB, expires_at REAL, "
+               "PRIMARY KEY (ns, k))")
+    cross_process = True
+
+    def __init__(self, path=None, prune_every=500):
+        super().__init__(path or DEFAULT_CACHE_DIR / "shared.sqlite")
+        self.prune_every, self._puts = prune_every, 0
+
+    def get(self, ns, key, default=None):
+        import pickle
+        row = self._conn().execute("SELECT v FROM cache WHERE ns = ? AND k = ? AND (expires_at IS NULL OR expires_at >= ?)",
+                                   (ns, self._key_text(key), time.time())).fetchone()
+        return pickle.loads(row[0]) if row else default
+
+    def put(self, ns, key, value, ttl=None):
+        import pickle
+        body = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._conn() as conn:
+            conn.execute("INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)",
+                         (ns, self._key_text(key), body, time.time() + ttl if ttl else None))
+        self._puts += 1
+        if self._puts % self.prune_every == 0:
+            self.prune()
+
+    def prune(self):
+        with self._conn() as conn:
+            conn.execute("DELETE FROM cache WHERE expires_at < ?", (time.time(),))
+
+    def claim(self, ns, key, ttl):
+        now = time.time()
+        with self._conn() as conn:
+            cur = conn.execute("INSERT INTO cache VALUES (?, ?, NULL, ?) ON CONFLICT(ns, k) DO UPDATE "
+                               "SET expires_at = excluded.expires_at WHERE cache.expires_at < ?",
+                               ("lease:" + ns, self._key_text(key), now + ttl, now))
+            return cur.rowcount == 1
+
+    def release(self, ns, key):
+        with self._conn() as conn:
+            conn.execute("DELETE FROM cache WHERE ns = ? AND k = ?", ("lease:" + ns, self._key_text(key)))
+
+SHARED_CACHE_KINDS = ("memory", "file", "sqlite")
+
+def make_shared_cache(kind="memory", cache_dir=None):
+    """공유 캐시 백엔드 생성 - memory(기본) / file(<cache_dir>/shared/) / sqlite(<cache_dir>/shared.sqlite)"""
+    kind = (kind or "memory").lower()
+    root = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+    if kind == "memory":
+        return MemoryCache()
+    if kind == "file":
+        return FileCache(root / "shared")
+    if kind == "sqlite":
+        return SqliteCache(root / "shared.sqlite")
+    raise ValueError(f"unknown cache backend: {kind} (choose from {', '.join(SHARED_CACHE_KINDS)})")
+
+class Translator:
+    """
+    검색어 번역 - 한글 없음 → 그대로, 로컬 사전 → SQLite 캐시 → 번역 API (성공 결과만 저장).
+    로컬 사전은 한→영뿐이므로 영어만 사전 사용, 일본어는 캐시 → API (메르카리에 실제 일본어 검색어 전달)
+    """
+    LEXICON_LANGS = ('en',)
+
+    def __init__(self, store=None, lexicon=None, timeout=2):
+        self.store, self.lexicon, self.timeout = store, lexicon, timeout
+        self._flight = SingleFlight()  # 같은 (검색어, 언어) 동시 API 호출 1회로 합침 (검색·워밍 겹칠 때)
+
+    def _fetch(self, text, lang):
+        url = TRANSLATE_URL.format(lang=lang, q=urllib.parse.quote(text))
+        return http_session(retry=False).get(url, timeout=self.timeout).json()[0][0][0]
+
+    def _fetch_and_store(self, text, lang):
+        dst = self._fetch(text, lang)
+        try:
+            if self.store is not None:
+                self.store.put(text, lang, dst)
+        except Exception:
+            pass
+        return dst
+
+    def _local(self, text, lang):
+        """네트워크·디스크 없이 정해지는 번역 (한글 없음 → 원문, 영어는 로컬 사전) - 없으면 None"""
+        if not _HANGUL.search(text):
+            return text
+        if lang in self.LEXICON_LANGS and self.lexicon is not None:
+            return self.lexicon.translate(text)
+        return None
+
+    def translate(self, text, lang='en'):
+        """번역 결과 - 실패 시 원문"""
+        local = self._local(text, lang)
+        if local:
+            return local
+        try:
+            cached = self.store.get(text, lang) if self.store is not None else None
+            if cached is not None:
+                return cached
+        except Exception:
+            pass
+        try:
+            return self._flight.do((text, lang), lambda: self._fetch_and_store(text, lang))
+        except Exception:
+            return text
+
+    def translate_async(self, text, langs=('en', 'ja')):
+        """언어별 Future 목록 - 한글 없음·사전 번역은 완료된 Future, 나머지는 공유 IO 스레드 풀에서 동시 실행"""
+        from concurrent.futures import Future
+        futures = []
+        for lang in langs:
+            local = self._local(text, lang)
+            if local:
+                f = Future()
+                f.set_result(local)
+            else:
+                f = io_executor().submit(self.translate, text, lang)
+            futures.append(f)
+        return futures
+
+    def translate_many(self, text, langs=('en', 'ja')):
+        """여러 언어 동시 번역 - 결과 tuple (langs 순서)"""
+        return tuple(f.result() for f in self.translate_async(text, langs))
+
+# ------------------------------------------------------------------
+# [Keyword Engine V2] 코드 DB 카테고리 + 연관 커뮤니티 태그
+# ------------------------------------------------------------------
+# === DB: Camera & Gear (확장) ===
+_CAMERA_DB = [
+    '카메라', 'camera', '렌즈', 'lens', '필름', 'film', 'dslr', '미러리스',
+    '라이카', 'leica', 'm3', 'm6', 'm11', 'q2', 'q3', 'x100v', 'x100vi',
+    '핫셀블라드', 'hasselblad', '핫셀', '500cm', 'x2d',
+    '린호프', 'linhof', '테크니카', 'technika',
+    '마미야', 'mamiya', 'rz67', 'rb67', '7ii',
+    '콘탁스', 'contax', 't2', 't3', 'g1', 'g2',
+    '브로니카', 'bronica', '젠자',
+    '롤라이', 'rollei', '35s', '35t',
+    '페이즈원', 'phaseone', 'iq4',
+    '리코', 'ricoh', 'gr2', 'gr3', 'gr3x', 'gr4',
+    '펜탁스', 'pentax', 'k1000', 'lx', '67',
+    '보이그랜더', 'voigtlander', '녹턴', '울트론',
+    '캐논', 'canon', '니콘', 'nikon', '소니', 'sony', '후지', 'fujifilm',
+    '올림푸스', 'olympus', '코닥', 'kodak', '인스타', 'insta360', '고프로', 'gopro'
+]
+
+# === DB: Fashion & Style (확장) ===
+_FASHION_DB = [
+    '나이키', 'nike', '조던', 'jordan', '덩크', 'dunk', '에어포스',
+    '아디다스', 'adidas', '이지', 'yeezy', '삼바', '가젤', '이지부스트',
+    '슈프림', 'supreme', '스투시', 'stussy', '팔라스', 'palace',
+    '요지', 'yohji', '야마모토', 'yamamoto', '와이쓰리', 'y-3',
+    '꼼데', 'commedesgarcons', '가르송',
+    '아크테릭스', 'arcteryx', '베타', '알파',
+    '노스페이스', 'northface', '눕시',
+    '스톤아일랜드', 'stoneisland', 'cp컴퍼니',
+    '뉴발란스', 'newbalance', '992', '993', '990', '2002r', '530',
+    '살로몬', 'salomon', '오클리', 'oakley', 'xt-6',
+    '젠틀몬스터', 'gentlemonster',
+    '구찌', 'gucci', '루이비통', 'louisvuitton', '샤넬', 'chanel', '에르메스', 'hermes',
+    '프라다', 'prada', '미우미우', 'miumiu', '보테가', 'bottega',
+    '롤렉스', 'rolex', '오메가', 'omega', '까르띠에', 'cartier',
+    '미하라', 'mihara', '크롬하츠', 'chromehearts', '비비안', 'vivienne'
+]
+
+# === DB: Tech & IT (확장) ===
+_TECH_DB = [
+    '컴퓨터', 'pc', '데스크탑', '노트북', 'laptop',
+    '그래픽', 'vga', 'gpu', 'rtx', 'gtx', '4090', '4080', '4070', '3080',
+    'cpu', 'amd', '라이젠', 'ryzen', '인텔', 'intel',
+    '아이폰', 'iphone', '15pro', '14pro', '13mini', '16pro',
+    '맥북', 'macbook', '에어', '프로', 'm1', 'm2', 'm3', 'm4',
+    '아이패드', 'ipad', '에어팟', 'airpods', '애플워치', 'applewatch',
+    '갤럭시', 'galaxy', 's24', 's23', 'zflip', 'zfold',
+    '플스', 'ps5', 'ps4', 'playstation', '닌텐도', 'nintendo', '스위치', 'switch',
+    '키보드', 'keyboard', '마우스', 'mouse', '모니터', 'monitor',
+    '스팀덱', 'steamdeck', '키크론', 'keychron', '해피해킹', 'hhkb',
+    '로지텍', 'logitech', '파이널마우스', 'wooting'
+]
+
+# === DB: Living (신규) ===
+_LIVING_DB = [
+    '허먼밀러', 'hermanmiller', '에어론', 'aeron',
+    '리모와', 'rimowa', '스노우피크', 'snowpeak', '브롬톤', 'brompton',
+    '헬리녹스', 'helinox', '다이슨', 'dyson', '발뮤다', 'balmuda',
+    '제네렉', 'genelec', '루이스폴센', 'louispoulsen'
+]
+
+# === DB: Game (신규) ===
+_GAME_DB = [
+    '플스', 'ps5', 'ps4', 'playstation', '듀얼센스', 'dualsense',
+    '닌텐도', 'nintendo', '스위치', 'switch', 'xbox', '엑스박스',
+    '피규어', '피그마', '레고', '건담', 'gundam', '뽀삐', '피그마'
+]
+
+# === DB: Deal (알뜰/핫딜 - 뽐뿌 등) ===
+_DEAL_DB = [
+    '핫딜', '알뜰', '세일', '뽐뿌', '쿠팡', '11번가', 'gmarket', '지마켓',
+    '옥션', 'auction', '와우', 'wow', '번개', '당근'
+]
+
+# === DB: Car (보배드림 등) ===
+_CAR_DB = [
+    '자동차', '중고차', '보배', 'bobaedream', '현대', '기아', 'bmw', '벤츠',
+    '테슬라', 'tesla', '제네시스', 'genesis', '쏘나타', '캐스퍼'
+]
+
+# === DB: Interior (오늘의집 등) ===
+_INTERIOR_DB = [
+    '인테리어', '가구', '오늘의집', 'ohou', '소파', '침대', '책상',
+    '조명', '램프', '의자', '테이블', '수납장', '화장대'
+]
+
+# classify_keyword 우선순위 순
+KEYWORD_CATEGORY_DB = [
+    ("CAMERA", _CAMERA_DB), ("FASHION", _FASHION_DB), ("TECH", _TECH_DB), ("LIVING", _LIVING_DB),
+    ("GAME", _GAME_DB), ("DEAL", _DEAL_DB), ("CAR", _CAR_DB), ("INTERIOR", _INTERIOR_DB),
+]
+
+# [Market Sources] 검색어 → 커뮤니티 태그 규칙 (keyword_community_tags에서 조합)
+COMMUNITY_TAG_DB = [
+    # APPLE - 아이폰, 맥북, 에어팟, 애플워치
+    ("apple_mobile", ['아이폰', 'iphone', '에어팟', 'airpods', '애플워치', 'applewatch', '아이패드', 'ipad',
+            '15pro', '14pro', '13mini', '16pro']),
+    ("apple_mac", ['맥북', 'macbook', '맥스튜디오', 'macstudio', '스튜디오디스플레이', 'm1', 'm2', 'm3', 'm4']),
+    # CAMERA (_CAMERA_DB 확장 반영)
+    ("camera", ['카메라', 'camera', '렌즈', 'lens', '필름', 'film', '라이카', 'leica', '니콘', 'nikon',
+            '캐논', 'canon', '소니', 'sony', '후지', 'fujifilm', '리코', 'ricoh', 'gr2', 'gr3', 'gr3x', 'gr4',
+            '핫셀', 'hasselblad', '콘탁스', 'contax', '마미야', 'mamiya', 'dslr', '미러리스', 'x100v', 'x100vi',
+            '롤라이', 'rollei', '브로니카', 'bronica', '페이즈원', 'phaseone', '린호프', 'linhof']),
+    # FASHION (_FASHION_DB 확장 반영)
+    ("fashion", ['나이키', 'nike', '조던', 'jordan', '덩크', 'dunk', '아디다스', 'adidas', '이지', 'yeezy',
+            '뉴발란스', 'newbalance', '살로몬', 'salomon', '슈프림', 'supreme', '스투시', 'stussy',
+            '아크테릭스', 'arcteryx', '노스페이스', 'northface', '스톤아일랜드', 'stoneisland',
+            '구찌', 'gucci', '루이비통', '샤넬', 'chanel', '에르메스', 'hermes', '롤렉스', 'rolex',
+            '미하라', 'mihara', '크롬하츠', 'chromehearts', '젠틀몬스터', 'gentlemonster', '오클리', 'oakley']),
+    # TECH (PC, 하드웨어)
+    ("tech", ['컴퓨터', 'pc', 'vga', 'gpu', 'rtx', 'gtx', '4090', '4080', '4070', '3080',
+            '그래픽', '라이젠', 'ryzen', '인텔', 'intel', 'cpu', 'amd', '키보드', 'keyboard',
+            '마우스', 'mouse', '모니터', 'monitor', '스팀덱', 'steamdeck', '키크론', 'keychron', '해피해킹', 'hhkb',
+            '로지텍', 'logitech', '파이널마우스', 'wooting']),
+    # MOBILE (갤럭시 등)
+    ("galaxy", ['갤럭시', 'galaxy', 's24', 's23', 'zflip', 'zfold']),
+    # GAME
+    ("game", ['플스', 'ps5', 'ps4', 'playstation', '닌텐도', 'nintendo', '스위치', 'switch',
+            'xbox', '엑스박스', '듀얼센스', 'dualsense', '게임', '피규어', '피그마', '레고', '건담', '뽀삐']),
+    # DEAL - 알뜰/핫딜 (테크·패션 검색 시 참고용)
+    ("deal", ['핫딜', '알뜰', '세일', '뽐뿌', '쿠팡', '11번가', 'gmarket', '지마켓', '옥션', 'auction']),
+    # CAR
+    ("car", ['자동차', '차', '보배', 'bobaedream', '중고차', '현대', '기아', 'bmw', '벤츠',
+            '테슬라', 'tesla', '제네시스', 'genesis', '쏘나타', '캐스퍼']),
+    # INTERIOR / LIVING
+    ("interior", ['인테리어', '가구', '오늘의집', 'ohou', '소파', '침대', '책상', '조명', '램프', '의자', '테이블',
+            '허먼밀러', 'hermanmiller', '리모와', 'rimowa', '스노우피크', '브롬톤', '다이슨', '발뮤다']),
+]
+
+class KeywordAutomaton:
+    """
+    Aho–Corasick 다중 패턴 매칭 - 라벨별 패턴 목록으로 1회 빌드,
+    키워드 한 번의 선형 스캔으로 포함된 모든 라벨을 bit mask로 반환
+    """
+
+    def __init__(self, groups):
+        self.bits = {}
+        self._goto, self._fail, self._out = [{}], [0], [0]
+        for n, (label, patterns) in enumerate(groups):
+            bit = self.bits.setdefault(label, 1 << n)
+            for p in patterns:
+                node = 0
+                for ch in p:
+                    nxt = self._goto[node].get(ch)
+                    if nxt is None:
+                        nxt = len(self._goto)
+                        self._goto[node][ch] = nxt
+                        self._goto.append({})
+                        self._fail.append(0)
+                        self._out.append(0)
+                    node = nxt
+                self._out[node] |= bit
+        # BFS로 실패 링크 + 출력 병합 (접미사 패턴 라벨까지 포함), 루트 자식의 실패 링크는 루트
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] |= self._out[self._fail[nxt]]
+                queue.append(nxt)
+
+    def scan(self, text):
+        goto, fail, out = self._goto, self._fail, self._out
+        node = mask = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            mask |= out[node]
+        return mask
+
+    def labels(self, text):
+        mask = self.scan(text)
+        return [label for label, bit in self.bits.items() if mask & bit]
+
+_KEYWORD_AUTOMATON = KeywordAutomaton(
+    [(cat, db) for cat, db in KEYWORD_CATEGORY_DB] + [("tag:" + name, db) for name, db in COMMUNITY_TAG_DB])
+
+def _keyword_key(keyword):
+    return str(keyword).lower().replace(" ", "")
+
+def _category_from_mask(mask):
+    for cat, _ in KEYWORD_CATEGORY_DB:
+        if mask & _KEYWORD_AUTOMATON.bits[cat]:
+            return cat
+    return None
+
+def _community_tags_from_mask(mask):
+    hit = lambda name: mask & _KEYWORD_AUTOMATON.bits["tag:" + name]
+    tags = set()
+    if hit("apple_mobile"):
+        tags |= {"APPLE", "MOBILE"}
+    if hit("apple_mac"):
+        tags |= {"APPLE", "TECH"}
+    if hit("camera"):
+        tags.add("CAMERA")
+    if hit("fashion"):
+        tags.add("FASHION")
+    if hit("tech"):
+        tags.add("TECH")
+    if hit("galaxy") and "APPLE" not in tags:
+        tags.add("MOBILE")
+    if hit("game"):
+        tags.add("GAME")
+    if hit("deal"):
+        tags.add("DEAL")
+    elif tags & {"TECH", "FASHION"}:
+        tags.add("DEAL")
+    if hit("car"):
+        tags.add("CAR")
+    if hit("interior"):
+        tags |= {"INTERIOR", "LIVING"}
+    return tags if tags else {"TECH"}  # fallback (연관 커뮤니티에 마켓 제외)
+
+def classify_keyword(keyword):
+    """코드 DB로 카테고리 판별 (CAMERA > FASHION > TECH > LIVING > GAME > DEAL > CAR > INTERIOR) 또는 None"""
+    return _category_from_mask(_KEYWORD_AUTOMATON.scan(_keyword_key(keyword)))
+
+def keyword_community_tags(keyword):
+    """검색어에 맞는 커뮤니티 태그 (Market Sources 연관) - classify_keyword와 같은 스캔 사용"""
+    return _community_tags_from_mask(_KEYWORD_AUTOMATON.scan(_keyword_key(keyword)))
+
+def scan_keyword(keyword):
+    """한 번의 스캔으로 (코드 DB 카테고리, 커뮤니티 태그)"""
+    mask = _KEYWORD_AUTOMATON.scan(_keyword_key(keyword))
+    return _category_from_mask(mask), _community_tags_from_mask(mask)
+
+def classify_many(keywords, categories=None):
+    """여러 키워드 일괄 분류 - categories(CategoryIndex)가 있으면 시트 분류 우선"""
+    out = []
+    for kw in keywords:
+        cat = categories.lookup(kw) if categories is not None else None
+        out.append(cat or classify_keyword(kw))
+    return out
+
+# ------------------------------------------------------------------
+# [Billboard Data Pools] - 2025 트렌드 확장 (카테고리당 50+ 항목)
+# 빌보드·자동완성·추천·번역 사전 공용. 모듈 상수라 프로세스당 1회 생성 (Streamlit 재실행마다 다시 만들지 않음)
+# ------------------------------------------------------------------
+MASTER_TREND = [
+    "아이폰 16 Pro", "갤럭시 S25", "맥북 에어 M4", "RTX 5090", "Steam Deck 2", "PS5 Pro", "Ricoh GR IV", "후지필름 X100VI",
+    "나이키 덩크 로우", "뉴발란스 550", "아디다스 삼바", "살로몬 ACS 프로", "Jordan 1 로우", "아식스 젤 1130", "New Balance 993", "Crocs 클로그",
+    "스투시", "캐하트 WIP", "아크테릭스 베타", "Stone Island", "노스페이스 눕시", "뉴발란스 2002R", "코스", "미하라 야스히로",
+    "라이카 Q3", "Leica M6", "Sony A7RV", "니콘 Z8", "Canon R6 Mark II", "DJI Mini 4 Pro", "GoPro Hero 13", "인스타360 Ace Pro",
+    "Stanley 퀀처", "다이슨 에어스트레이트", "발뮤다 토스터", "허먼밀러 에어론", "Rimowa", "브롬톤", "Snow Peak", "Helinox",
+    "롤렉스 서브마리너", "오메가 스피드마스터", "샤넬 클래식", "에르메스 버킨", "프라다 나일론", "Bottega Veneta", "Miu Miu", "디메즐",
+    "Keychron Q1", "NuPhy Air75", "해피해킹", "로지텍 MX Master 3S", "애플워치 울트라 2", "AirPods Pro 2", "아이패드 프로 M4", "Mac Studio",
+    "Garmin Fenix 7", "Bose QC 울트라", "소니 WH-1000XM6", "카시나", "우로보로스", "제네렉", "루이스폴센"
+]
+
+MASTER_VIBE = [
+    "Stüssy", "스투시", "Carhartt WIP", "캐하트", "Arc'teryx", "아크테릭스", "Stone Island", "스톤아일랜드",
+    "Palace", "팔라스", "KITH", "키스", "Human Made", "휴먼메이드", "Aimé Leon Dore", "에임레온도어",
+    "Needles", "니들스", "Auralee", "오로리", "Engineered Garments", "엔지니어드 가먼츠",
+    "Birkenstock", "비르켄슈톡", "Porter", "포터", "Freitag", "프라이탁",
+    "Comoli", "꼼올리", "Beams", "비즈", "United Arrows", "유나이티드 애로우즈",
+    "Visvim", "비스빔", "Kapital", "카피탈", "Nanamica", "나나미카",
+    "Acne Studios", "아크네", "Toteme", "토템", "Lemaire", "르메르",
+    "Muji", "무인양품", "Uniqlo U", "유니클로 U", "COS", "코스"
+]
+
+MASTER_SNEAKERS = [
+    "Nike Dunk Low", "나이키 덩크 로우", "Jordan 1 Low", "조던 1 로우", "Jordan 4", "조던 4", "Jordan 11", "조던 11",
+    "New Balance 550", "뉴발란스 550", "New Balance 993", "뉴발란스 993", "New Balance 2002R", "뉴발란스 2002R", "New Balance 990", "뉴발란스 990",
+    "Adidas Samba", "아디다스 삼바", "Adidas Gazelle", "아디다스 가젤", "Salomon ACS Pro", "살로몬 ACS 프로", "Salomon XT-6", "살로몬 XT-6",
+    "Asics Gel-1130", "아식스 젤 1130", "Asics Gel-Kayano 14", "아식스 젤카야노", "Hoka One One", "호카", "Hoka Clifton", "호카 클리프톤",
+    "Crocs 클로그", "크록스", "Yeezy 350", "이지 350", "Yeezy Slide", "이지 슬라이드", "Converse Chuck 70", "컨버스 척 70",
+    "Vans Old Skool", "반스 올드스쿨", "Onitsuka Tiger", "오니츠카 타이거", "Balenciaga Track", "발렌시아가 트랙",
+    "Rick Owens", "릭 오웬스", "Maison Margiela Tabi", "마르지엘라 타비", "미하라 야스히로", "카시나", "디메즐"
+]
+
+MASTER_LUXURY = [
+    "Rolex Submariner", "롤렉스 서브마리너", "Rolex Daytona", "롤렉스 데이토나", "Rolex GMT", "롤렉스 GMT", "Rolex Datejust", "롤렉스 데이저스트",
+    "Omega Speedmaster", "오메가 스피드마스터", "Cartier Tank", "까르띠에 탱크", "Cartier Santos", "까르띠에 산토스",
+    "Chanel Classic Flap", "샤넬 클래식", "Chanel Boy", "샤넬 보이", "Hermes Birkin", "에르메스 버킨", "Hermes Kelly", "에르메스 켈리",
+    "Louis Vuitton", "루이비통", "Goyard", "고야드", "Dior Saddle", "디올 새들", "Celine Triomphe", "셀린느 트리옹프",
+    "Bottega Veneta", "보테가 베네타", "Prada Nylon", "프라다 나일론", "Gucci Jackie", "구찌 재키", "Loewe Puzzle", "로에베 퍼즐",
+    "Rimowa", "리모와", "Chrome Hearts", "크롬하츠", "Van Cleef", "반클리프", "Tiffany", "티파니", "Bulgari", "불가리"
+]
+
+MASTER_TECH = [
+    "iPhone 16 Pro", "아이폰 16 프로", "iPhone 16", "아이폰 16", "Galaxy S25", "갤럭시 S25", "Galaxy Z Fold 6", "갤럭시 Z폴드",
+    "MacBook Air M4", "맥북 에어 M4", "MacBook Pro M4", "맥북 프로 M4", "iPad Pro M4", "아이패드 프로 M4", "Mac Studio", "맥 스튜디오",
+    "RTX 5090", "RTX 5080", "RTX 4090", "Steam Deck 2", "Steam Deck OLED", "PS5 Pro", "PlayStation 5", "플스5",
+    "Nintendo Switch 2", "닌텐도 스위치 2", "Switch OLED", "스위치 OLED",
+    "Keychron Q1", "키크론 Q1", "NuPhy Air75", "누피 에어75", "해피해킹", "HHKB", "로지텍 MX Master 3S", "로지텍 마스터",
+    "Apple Watch Ultra 2", "애플워치 울트라", "AirPods Pro 2", "에어팟 프로", "Bose QC Ultra", "보스 QC", "Sony XM6", "소니 헤드폰",
+    "DJI Mini 4 Pro", "DJI 미니 4", "GoPro Hero 13", "고프로 13", "Insta360 Ace Pro", "인스타360",
+    "Garmin Fenix 7", "가민 페닉스", "Studio Display", "스튜디오 디스플레이", "LG StanbyME", "LG 스탠바이미"
+]
+
+MASTER_LIVING = [
+    "Stanley Quencher", "스탠리 퀀처", "Stanley 텀블러", "스탠리 텀블러", "Yeti", "예티", "Hydro Flask", "하이드로플라스크",
+    "Dyson Airstrait", "다이슨 에어스트레이트", "Dyson V15", "다이슨 V15", "Dyson Airwrap", "다이슨 에어랩",
+    "Balmuda Toaster", "발뮤다 토스터", "Balmuda Kettle", "발뮤다 전기포트",
+    "Herman Miller Aeron", "허먼밀러 에어론", "Herman Miller Embody", "허먼밀러 엠바디",
+    "Rimowa", "리모와", "Brompton", "브롬톤", "Super73", "슈퍼73", "Strida", "스트라이더",
+    "Snow Peak", "스노우피크", "Helinox", "헬리녹스", "Coleman", "콜맨",
+    "Nespresso", "네스프레소", "Fellow Ode", "펠로우 오드", "Comandante C40", "코만단테",
+    "Moccamaster", "모카마스터", "Balmuda Coffee", "발뮤다 커피머신",
+    "Genelec", "제네렉", "Sonos", "소노스", "Bose", "보스",
+    "Roborock S8", "로보락 S8", "LG Styler", "LG 스타일러", "Dyson V15", "다이슨 청소기"
+]
+
+MASTER_GAME = [
+    "PS5 Pro", "PlayStation 5", "플스5", "Nintendo Switch 2", "닌텐도 스위치 2", "Switch OLED", "스위치 OLED",
+    "Steam Deck 2", "Steam Deck OLED", "스팀덱", "Xbox Series X", "엑스박스",
+    "RTX 5090", "RTX 5080", "RTX 4090", "게임 그래픽카드",
+    "DualSense", "듀얼센스", "Xbox 컨트롤러", "Pro Controller", "프로콘",
+    "게임 피규어", "피그마", "레고 스타워즈", "반다이 건담"
+]
+
+MASTER_OUTDOOR = [
+    "Snow Peak", "스노우피크", "Helinox", "헬리녹스", "Coleman", "콜맨", "노르디스크",
+    "캠핑 텐트", "캠핑체어", "캠핑테이블", "캠핑랜턴",
+    "Brompton", "브롬톤", "Super73", "슈퍼73", "Strida", "스트라이더",
+    "등산화", "등산배낭", "아크테릭스", "노스페이스", "살로몬",
+    "Stanley 텀블러", "Yeti", "예티", "Hydro Flask", "하이드로플라스크"
+]
+
+MASTER_POOLS = (MASTER_TREND, MASTER_VIBE, MASTER_SNEAKERS, MASTER_LUXURY,
+                MASTER_TECH, MASTER_LIVING, MASTER_GAME, MASTER_OUTDOOR)
+
+# [자동완성] 시트 + 빌보드 키워드 통합 (시트 부족해도 풍부한 자동완성)
+AUTOCOMPLETE_POOL = list(dict.fromkeys(
+    MASTER_TREND + MASTER_SNEAKERS + MASTER_TECH + MASTER_LUXURY +
+    MASTER_LIVING + MASTER_GAME + MASTER_OUTDOOR + MASTER_VIBE
+))
+
+@functools.lru_cache(maxsize=1)
+def suggestion_pools():
+    """
+    [추천검색어] 카테고리별 풀 - 마우스→모카마스터 같은 무관 추천 방지 (아이폰처럼 연관만).
+    CAMERA는 자동완성 풀 분류 결과라 첫 호출 때 1회 계산 (import 비용 없음)
+    """
+    camera = {k for k, c in zip(AUTOCOMPLETE_POOL, classify_many(AUTOCOMPLETE_POOL)) if c == "CAMERA"}
+    return {"TECH": frozenset(MASTER_TECH + MASTER_GAME),
+            "FASHION": frozenset(MASTER_SNEAKERS + MASTER_LUXURY + MASTER_VIBE),
+            "CAMERA": frozenset(camera),
+            "LIVING": frozenset(MASTER_LIVING),
+            "GAME": frozenset(MASTER_GAME)}
+
+# [Market Sources] 검색어별 연관 커뮤니티 매핑 - Market Sources 탭과 동기화
+# (name, url, tag, relevance_tags, desc) - desc: Market Sources처럼 설명 표시
+# relevance_tags: APPLE, CAMERA, TECH, PC, MOBILE, FASHION, GAME, DEAL, CAR, INTERIOR, LIVING, GENERAL
+COMMUNITY_SOURCES = [
+    # Apple & Life
+    ("아사모", "https://cafe.naver.com/appleiphone", "asamo", ["APPLE", "MOBILE"], "아이폰/아이패드 사용자"),
+    ("맥쓰사", "https://cafe.naver.com/inmacbook", "mac", ["APPLE", "TECH"], "맥북/맥 사용자 모임"),
+    # Camera & Gear
+    ("SLR클럽", "https://www.slrclub.com", "slr", ["CAMERA"], "국내 최대 카메라 장터"),
+    ("라이카 클럽", "http://www.leicaclub.net/", "leica", ["CAMERA"], "Leica 전문"),
+    ("필름카메라 동호회", "https://cafe.naver.com/35mmcamera", "film", ["CAMERA"], "필름카메라 커뮤니티"),
+    ("DOF LOOK", "https://cafe.naver.com/doflook", "dof", ["CAMERA"], "전문 촬영 장비"),
+    # Tech & PC
+    ("퀘이사존", "https://quasarzone.com", "quasar", ["TECH", "PC"], "PC/하드웨어 뉴스"),
+    ("쿨엔조이", "https://coolenjoy.net", "cool", ["TECH", "PC"], "PC 하드웨어 매니아"),
+    ("미코", "https://meeco.kr", "meeco", ["TECH", "MOBILE"], "모바일/테크 정보"),
+    ("클리앙", "https://www.clien.net", "clien", ["TECH", "DEAL"], "IT/알뜰구매"),
+    # Game & Hobby
+    ("루리웹 장터", "https://bbs.ruliweb.com/market", "ruli", ["GAME"], "게임/피규어/취미"),
+    # Deal & Sale
+    ("뽐뿌", "https://www.ppomppu.co.kr", "pompu", ["DEAL"], "알뜰구매/핫딜"),
+    # Fashion & Style
+    ("KREAM", "https://kream.co.kr", "kream", ["FASHION"], "한정판 거래 플랫폼"),
+    ("나이키매니아", "https://cafe.naver.com/sssw", "nike", ["FASHION"], "스니커즈/스트릿"),
+    ("어미새", "https://eomisae.co.kr", "eomisae", ["FASHION", "DEAL"], "글로벌 세일 정보"),
+    ("디젤매니아", "https://cafe.naver.com/dieselmania", "diesel", ["FASHION"], "남성 패션 커뮤니티"),
+    ("무신사", "https://www.musinsa.com", "musinsa", ["FASHION"], "스트릿/스니커즈"),
+    # Car
+    ("보배드림", "https://www.bobaedream.co.kr", "bobaedream", ["CAR"], "중고차/자동차 커뮤니티"),
+    # Interior & Living
+    ("오늘의집", "https://ohou.se", "ohou", ["INTERIOR", "LIVING"], "인테리어/가구"),
+]
+
+def get_related_communities(keyword):
+    """검색어에 맞는 커뮤니티만 추천 (번개장터·중고나라 등 마켓 제외, 최대 5개)"""
+    tags = keyword_community_tags(keyword)
+    matched = []
+    for name, url, tag, comm_tags, desc in COMMUNITY_SOURCES:
+        if tags & set(comm_tags):
+            matched.append((name, url, tag, desc))
+    if not matched:
+        return None, None
+    # 중복 제거, 최대 5개 (너무 많으면 산만함)
+    seen = set()
+    result = []
+    for m in matched:
+        if m[2] not in seen:
+            seen.add(m[2])
+            result.append(m)
+            if len(result) >= 5:
+                break
+    title = "💡 연관 커뮤니티 (Market Sources)"
+    return title, result
+
+# ------------------------------------------------------------------
+# [직구 비용] 관세 8% + 부가세 10% (200달러 초과), 배송비 3만원
+# ------------------------------------------------------------------
+def calculate_total_import_cost(usd_price, rate):
+    if usd_price <= 0: return 0
+    krw_base = usd_price * rate
+    shipping = 30000 
+    if usd_price > 200: 
+        duty = krw_base * 0.08
+        vat = (krw_base + duty) * 0.1
+        return (krw_base + duty + vat + shipping) / 10000
+    return (krw_base + shipping) / 10000
+
+def calculate_import_breakdown(usd_price, rate):
+    """직구 비용 상세: (물품가격, 관세, 부가세, 배송비) KRW 원 단위"""
+    if usd_price <= 0: return None
+    krw_base = int(usd_price * rate)
+    shipping = 30000
+    if usd_price > 200:
+        duty = int(krw_base * 0.08)
+        vat = int((krw_base + duty) * 0.1)
+        return {"물품가격": krw_base, "관세": duty, "부가세": vat, "배송비": shipping, "총액": krw_base + duty + vat + shipping}
+    return {"물품가격": krw_base, "관세": 0, "부가세": 0, "배송비": shipping, "총액": krw_base + shipping}
+
+def get_trend_data_batch(queries, df):
+    """
+    여러 검색어를 시트 한 번 인덱싱으로 일괄 조회 - 검색어마다 get_trend_data_from_sheet와 같은 dict(또는 None)
+    """
+    return PriceIndex(df).lookup_many(queries)
+
+# ------------------------------------------------------------------
+# [검색 캐시] 시트 버전별 파생 캐시 + 검색어 로그 + 시트 갱신 후 캐시 워밍
+# ------------------------------------------------------------------
+class SheetCaches:
+    """
+    시트 버전별 파생 캐시 - PriceIndex·CategoryIndex·Translator는 최근 versions개 버전만, 시세 조회 결과는 (버전, 정규화 검색어) LRU.
+    Streamlit 없이 동작 → 요청 스레드와 백그라운드 워밍이 같은 객체 공유.
+    shared가 프로세스 간 백엔드(file/sqlite)면 시세 조회 결과를 레플리카끼리 공유 (키: 시트 내용 해시 버전 → 같은 시트면 같은 키)
+    """
+    SHARED_TTL = 86400  # 공유 시세 결과 보관 - 지난 시트 버전 결과는 하루 뒤 정리
+
+    def __init__(self, store=None, pools=(), trend_size=2000, versions=4, shared=None):
+        self.store, self.pools = store, pools
+        self.shared = shared if shared is not None and shared.cross_process else None
+        self.objects = VersionedLRU(maxsize=versions * 3)
+        self.trend_cache = VersionedLRU(maxsize=trend_size)
+
+    def price_index(self, df):
+        return self.objects.get_or_compute(sheet_version(df), "price", lambda: PriceIndex(df))
+
+    def category_index(self, df):
+        return self.objects.get_or_compute(sheet_version(df), "category", lambda: CategoryIndex(df))
+
+    def translator(self, df):
+        # 로컬 사전: 브랜드 쌍 + 빌보드 풀(영문, 한글 순) + 시트 한·영 키워드 컬럼
+        return self.objects.get_or_compute(sheet_version(df), "translator",
+                                           lambda: Translator(self.store, Lexicon(self.pools, df)))
+
+    def trend(self, query, df):
+        """시세 조회 (get_trend_data_from_sheet) - 빈 시트·2글자 미만 검색어는 None"""
+        if df is None or df.empty or not query:
+            return None
+        if len(query.lower().replace(" ", "").strip()) < 2:
+            return None
+        version, key = sheet_version(df), PriceIndex.query_key(query)
+        compute = lambda: self.price_index(df).lookup(query)
+        if self.shared is not None:
+            local = compute
+            compute = lambda: self.shared.get_or_compute("trend", (version, key), local, self.SHARED_TTL)
+        return self.trend_cache.get_or_compute(version, key, compute)
+
+    def category(self, keyword, df=None):
+        """시트 분류 우선 → 코드 DB 분류"""
+        if df is not None and not df.empty and keyword and len(str(keyword).strip()) >= 2:
+            sheet_cat = self.category_index(df).lookup(keyword)
+            if sheet_cat:
+                return sheet_cat
+        return classify_keyword(keyword)
+
+    def warm(self, query, df, langs=('en', 'ja')):
+        """검색 1회와 같은 캐시 경로 통과 - 시세 매칭, 분류 메모, 번역 (사전 → SQLite → API, 호출 스레드에서 순서대로)"""
+        self.trend(query, df)
+        self.category(query, df)
+        translator = self.translator(df)
+        for lang in langs:
+            translator.translate(query, lang)
+
+    def stats(self):
+        """캐시별 stats + coalesced (동시 요청 합침으로 아낀 인덱스 빌드·시세 매칭 수)"""
+        objects, trend = self.objects.stats(), self.trend_cache.stats()
+        return {"objects": objects, "trend": trend, "coalesced": objects["coalesced"] + trend["coalesced"]}
+
+class QueryLog(_SqliteStore):
+    """검색어 로그 (SQLite) - 검색어별 횟수·마지막 시각, 캐시 워밍용 인기 검색어 top(n)"""
+    _SCHEMA = ("CREATE TABLE IF NOT EXISTS queries (q TEXT PRIMARY KEY, hits INTEGER NOT NULL, "
+               "last_at REAL NOT NULL)")
+
+    def __init__(self, path=None):
+        super().__init__(path or DEFAULT_CACHE_DIR / "queries.sqlite")
+
+    def record(self, query):
+        q = " ".join(str(query).split())
+        if not 2 <= len(q) <= 100:
+            return
+        with self._conn() as conn:
+            conn.execute("INSERT INTO queries VALUES (?, 1, ?) "
+                         "ON CONFLICT(q) DO UPDATE SET hits = hits + 1, last_at = excluded.last_at", (q, time.time()))
+
+    def top(self, n=200):
+        rows = self._conn().execute("SELECT q FROM queries ORDER BY hits DESC, last_at DESC LIMIT ?", (n,))
+        return [r[0] for r in rows]
+
+    def __len__(self):
+        return self._conn().execute("SELECT COUNT(*) FROM queries").fetchone()[0]
+
+class CacheWarmer:
+    """
+    시트 버전별 캐시 워밍 - 버전마다 1회, 백그라운드 스레드가 전용 풀(workers개)로 검색어마다 warm(q) 실행.
+    start()는 바로 반환 (요청·갱신 스레드 비차단). 도중에 새 버전이 시작되면 이전 버전 남은 검색어는 건너뜀. stats()로 진행 확인
+    """
+
+    def __init__(self, workers=4):
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._version = None
+        self._stats = {}
+
+    def start(self, version, queries, warm):
+        with self._lock:
+            if version == self._version:
+                return False
+            self._version = version
+        queries = tuple(dict.fromkeys(q for q in queries if q))
+        threading.Thread(target=self._run, args=(version, queries, warm), name="radar-warmup", daemon=True).start()
+        return True
+
+    def _run(self, version, queries, warm):
+        from concurrent.futures import ThreadPoolExecutor
+        stats = {"version": version, "total": len(queries), "done": 0, "errors": 0, "skipped": 0,
+                 "started_at": time.time(), "seconds": None}
+        self._stats = stats
+
+        def one(q):
+            outcome = "skipped"
+            if self._version == version:
+                try:
+                    warm(q)
+                    outcome = "done"
+                except Exception:
+                    outcome = "errors"
+            with self._lock:
+                stats[outcome] += 1
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="radar-warm") as pool:
+            list(pool.map(one, queries))
+        stats["seconds"] = round(time.time() - stats["started_at"], 3)
+
+    def stats(self):
+        return dict(self._stats)
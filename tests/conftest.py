@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# 저장소 루트(radar_engine.py, benchmark.py)를 import 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
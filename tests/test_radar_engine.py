@@ -0,0 +1,403 @@
+"""
+radar_engine 회귀 테스트 - 네트워크 없이 실행
+
+    python -m pytest -q
+
+  - PriceIndex.lookup ↔ 기존 행 순회 매칭(app.py get_trend_data_from_sheet 원본) 결과 동일
+  - lookup_many ↔ lookup 반복 결과 동일
+  - 공유 캐시 키가 해시 시드가 다른 프로세스에서도 같은 문자열
+  - SheetSnapshot ETag/304 조건부 갱신
+  - FileCache/SqliteCache claim/release 임대
+"""
+import difflib
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import radar_engine
+from benchmark import make_sheet, make_queries
+from radar_engine import FileCache, PriceIndex, SharedCache, SheetSnapshot, SqliteCache
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+# ---------------------------------------------------------------------------
+# 기존 행 순회 매칭 (app.py get_trend_data_from_sheet 원본 이식 - 비교 기준)
+# 원본의 user_variants(자동완성 풀 유사어)는 매칭에 쓰이지 않아 생략
+# ---------------------------------------------------------------------------
+
+def _ref_date_cols(df):
+    skip_keywords = ['키워드', 'keyword', '모델명', '상세스펙', '분류', '브랜드', '해외', 'usd', '비고', '메모', '링크', 'url']
+    c_lower = lambda s: str(s).lower().strip()
+    patterns = ['월', '주', 'week', 'date', '날짜', '주차', 'w1', 'w2', 'w3', 'w4', 'w5', '가격', 'price', '1주', '2주', '3주', '4주', '5주']
+    date_cols = [c for c in df.columns if not any(sk in c_lower(c) for sk in skip_keywords)
+                 and any(p in c_lower(c) for p in patterns)]
+    if not date_cols and len(df.columns) >= 2:
+        date_cols = list(df.columns[1:])
+    return sorted(date_cols, key=lambda x: str(x)) if date_cols else list(df.columns[1:6]) if len(df.columns) >= 2 else ["12월4주", "1월1주", "1월2주", "1월3주", "1월4주"]
+
+def _ref_get_col(row, *names):
+    for n in names:
+        v = row.get(n, None)
+        if pd.notna(v) and str(v).strip():
+            return str(v).strip()
+    for c in row.index:
+        c_low = str(c).lower()
+        if any(x in c_low for x in ['모델', '키워드', '제품', '상품', '이름', '품목', 'keyword', 'product', 'name', 'leica', '라이카']):
+            v = row.get(c, None)
+            if pd.notna(v) and str(v).strip() and str(v).lower() != 'nan':
+                return str(v).strip()
+    if len(row) >= 1:
+        v = row.iloc[0]
+        if pd.notna(v) and str(v).strip() and str(v).lower() != 'nan' and not re.match(r'^[\d\s,.;]+$', str(v)):
+            return str(v).strip()
+    return ''
+
+def _ref_raw_price_str(row):
+    for col in ['시세 (5주치)', '시세(5주치)', 'prices_raw', '거래가목록', '시세', '가격목록', '거래가', '가격']:
+        v = row.get(col, None)
+        if pd.notna(v) and str(v).strip() and str(v).lower() != 'nan':
+            return str(v).strip()
+    for c in row.index:
+        v = row.get(c, None)
+        if pd.notna(v):
+            s = str(v).strip()
+            if ',' in s and re.search(r'\d', s) and len(re.findall(r'\d+', s)) >= 2:
+                return s
+    return ''
+
+def _ref_usd_val(row):
+    for col in ['해외평균(USD)', '해외평균(usd)', '해외평균', 'usd', 'global_usd', '해외가격']:
+        v = row.get(col, None)
+        if pd.notna(v):
+            clean = re.sub(r'[^0-9.]', '', str(v))
+            if clean:
+                try:
+                    return float(clean)
+                except ValueError:
+                    pass
+    return 0.0
+
+def _ref_normalize(s):
+    s = str(s).lower().replace(" ", "").strip()
+    pairs = [("스타일러", "styler"), ("스탠바이미", "stanbyme"), ("라이카", "leica"), ("아이폰", "iphone"),
+             ("나이키", "nike"), ("갤럭시", "galaxy"), ("맥북", "macbook"), ("소니", "sony"), ("니콘", "nikon"),
+             ("캐논", "canon"), ("후지", "fuji"), ("올림푸스", "olympus"), ("파나소닉", "panasonic")]
+    for ko, en in pairs:
+        s = s.replace(ko, en)
+    return s
+
+def _ref_numbers(s):
+    return set(re.findall(r'\d+', str(s)))
+
+def _ref_model_tokens(s):
+    s = str(s).lower().replace(" ", "")
+    return {m.group(1) + m.group(2) for m in re.finditer(r'([a-z])(\d+)\b', s)}
+
+def _ref_prices(text):
+    out = []
+    for part in text.replace(';', ',').split(','):
+        clean = re.sub(r'[^0-9.]', '', part)
+        if clean:
+            try:
+                val = float(clean)
+                if val > 0:
+                    out.append(val)
+            except ValueError:
+                pass
+    return out
+
+def reference_lookup(user_query, df):
+    if df.empty or not user_query: return None
+    user_clean = user_query.lower().replace(" ", "").strip()
+    if len(user_clean) < 2: return None
+    user_nums = _ref_numbers(user_query)
+    user_norm = _ref_normalize(user_query)
+    date_cols = _ref_date_cols(df)
+    candidates = []
+    for _, row in df.iterrows():
+        try:
+            k_val = _ref_get_col(row, '모델명', '키워드', 'keyword')
+            if not k_val:
+                for c in row.index:
+                    v = row.get(c, None)
+                    if pd.notna(v) and str(v).strip() and str(v).lower() != 'nan' and not re.match(r'^[\d\s,.;]+$', str(v)):
+                        k_val = str(v).strip()
+                        break
+            if not k_val: continue
+            sheet_keyword = str(k_val).lower().replace(" ", "").strip()
+            sheet_norm = _ref_normalize(str(k_val))
+            sheet_nums = _ref_numbers(k_val)
+            match = (user_clean in sheet_keyword or sheet_keyword in user_clean or
+                     user_norm in sheet_norm or sheet_norm in user_norm)
+            if not match and len(sheet_keyword) >= 2:
+                match = difflib.SequenceMatcher(None, user_norm, sheet_norm).ratio() >= 0.80
+            if not match:
+                continue
+            if user_nums and sheet_nums and not (user_nums & sheet_nums):
+                continue
+            user_tokens, sheet_tokens = _ref_model_tokens(user_query), _ref_model_tokens(k_val)
+            if user_tokens and sheet_tokens and not (user_tokens & sheet_tokens):
+                continue
+            prices_per_week = []
+            for col in date_cols:
+                if col not in df.columns:
+                    continue
+                v_raw = str(row.get(col, '')).strip()
+                if not v_raw or v_raw.lower() == 'nan':
+                    continue
+                week_prices = _ref_prices(v_raw)
+                if week_prices:
+                    prices_per_week.append((col, week_prices))
+            trend_prices = [sum(p) / len(p) for _, p in prices_per_week]
+            valid_dates = [d for d, _ in prices_per_week]
+            raw_prices = [x for _, p in prices_per_week for x in p]
+            raw_str = _ref_raw_price_str(row)
+            if raw_str:
+                raw_prices.extend(_ref_prices(raw_str))
+            if not raw_prices:
+                raw_prices = list(trend_prices)
+            global_usd = _ref_usd_val(row)
+            if not trend_prices and raw_prices:
+                trend_prices = [sum(raw_prices) / len(raw_prices)]
+                valid_dates = ["시세"]
+            if not trend_prices:
+                continue
+            name = _ref_get_col(row, '모델명', '모델명 (상세스펙/상태)')
+            spec = _ref_get_col(row, '상세스펙')
+            if spec:
+                name = f"{name} ({spec})".strip() if name else spec
+            name = name or '상품명 미상'
+            this_week_prices = prices_per_week[-1][1] if prices_per_week else []
+            _p = this_week_prices if this_week_prices else raw_prices
+            if len(_p) >= 4:
+                _p = np.array(_p)
+                q1, q3 = np.percentile(_p, 25), np.percentile(_p, 75)
+                iqr = q3 - q1
+                _filt = _p[(_p >= q1 - 1.5 * iqr) & (_p <= q3 + 1.5 * iqr)]
+                _p = _filt if len(_filt) >= 2 else _p
+            summary_avg = float(np.median(_p)) if len(_p) else (trend_prices[-1] if trend_prices else 0)
+            summary_min = float(np.percentile(_p, 25)) if len(_p) >= 4 else (min(_p) if len(_p) else 0)
+            summary_max = float(np.percentile(_p, 75)) if len(_p) >= 4 else (max(_p) if len(_p) else 0)
+            len_diff = abs(len(user_clean) - len(sheet_keyword))
+            exact = 0 if user_clean == sheet_keyword else 1
+            candidates.append((len_diff, exact, {
+                "name": name, "dates": valid_dates, "trend_prices": trend_prices, "raw_prices": raw_prices,
+                "global_usd": global_usd, "matched_keyword": k_val,
+                "summary_avg": summary_avg, "summary_min": summary_min, "summary_max": summary_max,
+                "summary_n": len(this_week_prices)}))
+        except Exception:
+            continue
+    if not candidates:
+        return None
+    candidates.sort(key=lambda x: (x[0], x[1]))
+    return candidates[0][2]
+
+
+def assert_same_result(got, want):
+    """문자열·목록 필드는 그대로, 시세 숫자는 부동소수 오차 허용"""
+    if want is None:
+        assert got is None
+        return
+    assert got is not None and set(got) == set(want)
+    for k, v in want.items():
+        if k in ("trend_prices", "raw_prices"):
+            assert list(got[k]) == pytest.approx(v, rel=1e-9), k
+        elif isinstance(v, float):
+            assert float(got[k]) == pytest.approx(v, rel=1e-9), k
+        else:
+            assert got[k] == v, k
+
+
+EDGE_QUERIES = ["", "x", "라이카", "leica m6", "라이카 M6", "M3", "Q3", "아이폰15", "iphone 15 pro", "아이폰 16 Pro Max",
+                "나이키 덩크", "sonya7rv", "Sony A7", "갤럭시S24", "맥북 에어 M3", "냉장고", "zzzz"]
+
+
+@pytest.fixture(scope="module")
+def sheet():
+    return make_sheet(800, seed=3)
+
+
+@pytest.fixture(scope="module")
+def queries(sheet):
+    return make_queries(sheet, 150, seed=5) + EDGE_QUERIES
+
+
+def test_lookup_matches_row_scan(sheet, queries):
+    index = PriceIndex(sheet)
+    for q in queries:
+        assert_same_result(index.lookup(q), reference_lookup(q, sheet))
+
+
+def test_lookup_matches_row_scan_custom_columns():
+    """모델명 대신 키워드 컬럼·상세스펙·가격 컬럼만 있는 시트"""
+    df = pd.DataFrame({
+        "키워드": ["라이카 M6", "라이카 Q3", "아이폰 15 프로", "후지 X100V", np.nan],
+        "상세스펙": ["블랙", "", "256GB", np.nan, "기타"],
+        "가격": ["300, 310; 295", "650", "120, 118, 119, 500", "abc", "10"],
+        "해외평균(USD)": ["$2,100", np.nan, "900", "", "1"],
+    })
+    index = PriceIndex(df)
+    for q in ["라이카 M6", "leica q3", "아이폰15프로", "iphone 15", "후지 X100V", "기타", "M3", "라이카"]:
+        assert_same_result(index.lookup(q), reference_lookup(q, df))
+
+
+def test_lookup_many_equals_lookup_loop(sheet, queries):
+    index = PriceIndex(sheet)
+    qs = queries + queries[:20]  # 중복 검색어 포함
+    assert index.lookup_many(qs) == [index.lookup(q) for q in qs]
+
+
+# ---------------------------------------------------------------------------
+# 공유 캐시 키 - 해시 시드가 다른 프로세스에서도 같은 문자열이어야 레플리카 간 적중
+# ---------------------------------------------------------------------------
+
+_KEY_SCRIPT = """
+import json, sys
+from radar_engine import PriceIndex, SharedCache
+qs = json.loads(sys.stdin.read())
+print(json.dumps([SharedCache._key_text(("v1", PriceIndex.query_key(q))) for q in qs]))
+"""
+
+def test_cache_keys_stable_across_processes():
+    qs = ["아이폰 15 프로 256GB 128", "라이카 M6 0.72 1984", "Sony A7 3 4 5 6 7 8 9", "냉장고"]
+    outputs = []
+    for seed in ("1", "2", "3"):
+        env = {**os.environ, "PYTHONHASHSEED": seed}
+        proc = subprocess.run([sys.executable, "-c", _KEY_SCRIPT], input=json.dumps(qs), capture_output=True,
+                              text=True, cwd=ROOT, env=env, check=True)
+        outputs.append(json.loads(proc.stdout))
+    assert outputs[0] == outputs[1] == outputs[2]
+    assert outputs[0] == [SharedCache._key_text(("v1", PriceIndex.query_key(q))) for q in qs]
+
+
+# ---------------------------------------------------------------------------
+# SheetSnapshot - ETag/Last-Modified 조건부 요청, 304는 checked_at만 갱신
+# ---------------------------------------------------------------------------
+
+_CSV = "모델명,1월1주,1월2주\n라이카 M6,\"300, 310\",305\n아이폰 15,120,118\n".encode("utf-8")
+
+
+class _Resp:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code, self.content, self.headers = status_code, content, headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+
+class _FakeSession:
+    """응답을 순서대로 돌려주고 요청 헤더 기록"""
+
+    def __init__(self, responses):
+        self.responses, self.requests = list(responses), []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def fake_http(monkeypatch):
+    def install(*responses):
+        session = _FakeSession(responses)
+        monkeypatch.setattr(radar_engine, "http_session", lambda retry=True: session)
+        return session
+    return install
+
+
+def test_snapshot_first_fetch_writes_files(tmp_path, fake_http):
+    http = fake_http(_Resp(200, _CSV, {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}))
+    snap = SheetSnapshot("https://example.invalid/sheet.csv", cache_dir=tmp_path)
+    df = snap.refresh()
+    assert list(df["모델명"]) == ["라이카 M6", "아이폰 15"]
+    assert http.requests == [{}]
+    meta = json.loads(snap.meta_path.read_text(encoding="utf-8"))
+    assert meta["etag"] == '"v1"' and meta["sha256"] and meta["rows"] == 2
+    assert snap.data_path.exists()
+    loaded, _ = snap.load()
+    assert list(loaded["모델명"]) == ["라이카 M6", "아이폰 15"]
+
+
+def test_snapshot_304_keeps_data_and_bumps_checked_at(tmp_path, fake_http):
+    lm = "Mon, 01 Jan 2024 00:00:00 GMT"
+    http = fake_http(_Resp(200, _CSV, {"ETag": '"v1"', "Last-Modified": lm}), _Resp(304))
+    snap = SheetSnapshot("https://example.invalid/sheet.csv", cache_dir=tmp_path)
+    snap.refresh()
+    before = json.loads(snap.meta_path.read_text(encoding="utf-8"))
+    time.sleep(0.01)
+    assert snap.refresh() is None
+    assert http.requests[1] == {"If-None-Match": '"v1"', "If-Modified-Since": lm}
+    after = json.loads(snap.meta_path.read_text(encoding="utf-8"))
+    assert after["checked_at"] > before["checked_at"]
+    assert {k: v for k, v in after.items() if k != "checked_at"} == {k: v for k, v in before.items() if k != "checked_at"}
+    assert not snap.is_stale(after)
+
+
+def test_snapshot_same_content_200_is_unchanged(tmp_path, fake_http):
+    """ETag 미지원 원본 - 같은 내용 해시면 변경 없음, 새 ETag만 기록"""
+    fake_http(_Resp(200, _CSV), _Resp(200, _CSV, {"ETag": '"v2"'}), _Resp(200, _CSV.replace(b"305", b"999")))
+    snap = SheetSnapshot("https://example.invalid/sheet.csv", cache_dir=tmp_path)
+    first = snap.refresh()
+    assert snap.refresh(first) is None
+    meta = json.loads(snap.meta_path.read_text(encoding="utf-8"))
+    assert meta["etag"] == '"v2"'
+    changed = snap.refresh()
+    assert changed is not None and json.loads(snap.meta_path.read_text(encoding="utf-8"))["sha256"] != meta["sha256"]
+    assert radar_engine.sheet_version(changed) != radar_engine.sheet_version(first)
+
+
+def test_snapshot_missing_data_file_refetches_unconditionally(tmp_path, fake_http):
+    http = fake_http(_Resp(200, _CSV, {"ETag": '"v1"'}), _Resp(200, _CSV, {"ETag": '"v1"'}))
+    snap = SheetSnapshot("https://example.invalid/sheet.csv", cache_dir=tmp_path)
+    snap.refresh()
+    snap.data_path.unlink()
+    assert snap.refresh() is not None  # 조건부 헤더 없이 다시 받아 데이터 파일 복구
+    assert http.requests[1] == {}
+    assert snap.load()[0] is not None
+
+
+# ---------------------------------------------------------------------------
+# 임대 (claim/release) - 레플리카 중 하나만 원본 조회
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(params=["file", "sqlite"])
+def shared_cache(request, tmp_path):
+    return FileCache(tmp_path / "shared") if request.param == "file" else SqliteCache(tmp_path / "shared.sqlite")
+
+
+def test_claim_is_exclusive_until_release(shared_cache):
+    assert shared_cache.claim("sheet-refresh", "abc", 30)
+    assert not shared_cache.claim("sheet-refresh", "abc", 30)
+    assert shared_cache.claim("sheet-refresh", "other", 30)  # 키별 임대
+    shared_cache.release("sheet-refresh", "abc")
+    assert shared_cache.claim("sheet-refresh", "abc", 30)
+    shared_cache.release("sheet-refresh", "abc")
+    shared_cache.release("sheet-refresh", "abc")  # 중복 해제 무시
+
+
+def test_expired_lease_can_be_reclaimed(shared_cache):
+    """임대한 프로세스가 release 없이 죽은 경우 - ttl이 지나면 회수 (호출자는 모두 같은 ttl 사용)"""
+    assert shared_cache.claim("sheet-refresh", "abc", 0.1)
+    assert not shared_cache.claim("sheet-refresh", "abc", 0.1)
+    time.sleep(0.3)
+    assert shared_cache.claim("sheet-refresh", "abc", 0.1)
+
+
+def test_claim_is_shared_between_instances(tmp_path):
+    """같은 경로를 여는 다른 인스턴스(=다른 프로세스)도 임대를 봄"""
+    for make in (lambda: FileCache(tmp_path / "shared"), lambda: SqliteCache(tmp_path / "shared.sqlite")):
+        a, b = make(), make()
+        assert a.claim("sheet-refresh", ("k", 1), 30)
+        assert not b.claim("sheet-refresh", ("k", 1), 30)
+        a.release("sheet-refresh", ("k", 1))
+        assert b.claim("sheet-refresh", ("k", 1), 30)